@@ -121,6 +121,10 @@ a = Analysis(
         'openpyxl',
         'pypdf',
         'pymupdf',
+        'orjson',
+        'fastnumbers',
+        'lxml',
+        'lxml.html',
         'playwright._impl._api_structures',
         'playwright._impl._browser_type',
         'playwright._impl._chromium',
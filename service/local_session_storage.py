@@ -12,6 +12,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up - stdlib json is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Import path utility
@@ -70,8 +75,11 @@ class LocalSessionStorage:
             session_path = self.get_session_path(broker_id)
             
             # Save session state to JSON file
-            with open(session_path, 'w') as f:
-                json.dump(session_state, f, indent=2)
+            if orjson is not None:
+                session_path.write_bytes(orjson.dumps(session_state, option=orjson.OPT_INDENT_2))
+            else:
+                with open(session_path, 'w') as f:
+                    json.dump(session_state, f, indent=2)
             
             logger.info(f"Saved session for broker {broker_id} to {session_path}")
             return True
@@ -96,8 +104,11 @@ class LocalSessionStorage:
                 return None
             
             # Load session state from JSON file
-            with open(session_path, 'r') as f:
-                session_state = json.load(f)
+            if orjson is not None:
+                session_state = orjson.loads(session_path.read_bytes())
+            else:
+                with open(session_path, 'r') as f:
+                    session_state = json.load(f)
             
             logger.info(f"Loaded session for broker {broker_id} from {session_path}")
             return session_state
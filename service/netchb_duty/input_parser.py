@@ -5,6 +5,21 @@ from __future__ import annotations
 import re
 from typing import Dict, List
 
+# Split on a separator and strip the surrounding whitespace in one pass.
+# Tab is excluded from the padding class so empty tab columns are preserved.
+_TAB_SPLIT_RE = re.compile(r"[^\S\t]*\t[^\S\t]*")
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+_WHITESPACE_SPLIT_RE = re.compile(r"\s+")
+# A run of 2+ whitespace characters of any kind (e.g. non-breaking spaces pasted from Excel)
+_WHITESPACE_RUN_RE = re.compile(r"\s{2,}")
+# A column holding an 11-digit run is taken to be the MAWB
+_MAWB_DIGITS_RE = re.compile(r"\d{11}")
+
+# Longest raw MAWB value accepted before normalization (guards against pasted prose)
+_MAX_MAWB_LENGTH = 64
+# Every byte except ASCII 0-9, for bytes.translate(None, ...) digit filtering
+_NONDIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
 
 def normalize_mawb(mawb: str) -> str:
     """
@@ -19,7 +34,12 @@ def normalize_mawb(mawb: str) -> str:
     Raises:
         ValueError: If MAWB doesn't contain exactly 11 digits
     """
-    digits = "".join(ch for ch in mawb if ch.isdigit())
+    if not 11 <= len(mawb) <= _MAX_MAWB_LENGTH:
+        raise ValueError(f"MAWB '{mawb}' length {len(mawb)} out of range")
+    if mawb.isascii():
+        digits = mawb.encode("ascii").translate(None, _NONDIGIT_BYTES).decode("ascii")
+    else:
+        digits = "".join(ch for ch in mawb if ch.isdigit())
     if len(digits) != 11:
         raise ValueError(f"MAWB '{mawb}' must contain exactly 11 digits, found {len(digits)}")
     return digits
@@ -52,23 +72,29 @@ def parse_mawb_input(text: str) -> List[Dict[str, str]]:
         if not line:
             continue
         
-        # Try to detect format by separator
+        # Try to detect format by separator: tab, then comma, then whitespace
+        # (at least two ASCII spaces anywhere, or any run of 2+ whitespace characters)
+        if line.find('\t') != -1:
+            sep = '\t'
+        elif line.find(',') != -1:
+            sep = ','
+        elif line.count(' ') >= 2 or _WHITESPACE_RUN_RE.search(line):
+            sep = ' '
+        else:
+            sep = None
+        
         # Check for tab-separated
-        if '\t' in line:
-            parts = [p.strip() for p in line.split('\t')]
+        if sep == '\t':
+            parts = _TAB_SPLIT_RE.split(line)
             checkbook_hawbs = None
             # Handle 5-column format: Port, Customer, Broker, HAWBs, Master
             if len(parts) >= 5:
-                # Find the MAWB (11 digits) - it should be the last column
+                # MAWB is the last column - normalize_mawb below rejects invalid values
                 mawb_raw = parts[4]
-                if re.search(r'\d{11}', mawb_raw):
-                    airport_code = parts[0] or None
-                    customer = parts[1] or None
-                    # Broker (parts[2]) is ignored - selected from dropdown
-                    checkbook_hawbs = parts[3] or None  # HAWBs at index 3
-                else:
-                    # Not a valid 5-column format, fall through to 3-column
-                    mawb_raw = None
+                airport_code = parts[0] or None
+                customer = parts[1] or None
+                # Broker (parts[2]) is ignored - selected from dropdown
+                checkbook_hawbs = parts[3] or None  # HAWBs at index 3
             elif len(parts) >= 3:
                 # Format: Airport Code, Customer, MAWB (backward compatible)
                 airport_code = parts[0] or None
@@ -77,13 +103,13 @@ def parse_mawb_input(text: str) -> List[Dict[str, str]]:
             elif len(parts) == 2:
                 # Could be MAWB + something else, or Airport + MAWB
                 # Try to identify which is MAWB (contains 11 digits)
-                if re.search(r'\d{11}', parts[0]):
+                if _MAWB_DIGITS_RE.search(parts[0]):
                     mawb_raw = parts[0]
-                    airport_code = parts[1] if parts[1] and not re.search(r'\d{11}', parts[1]) else None
+                    airport_code = parts[1] if parts[1] and not _MAWB_DIGITS_RE.search(parts[1]) else None
                     customer = None
                     checkbook_hawbs = None
-                elif re.search(r'\d{11}', parts[1]):
-                    airport_code = parts[0] if parts[0] and not re.search(r'\d{11}', parts[0]) else None
+                elif _MAWB_DIGITS_RE.search(parts[1]):
+                    airport_code = parts[0] if parts[0] and not _MAWB_DIGITS_RE.search(parts[0]) else None
                     mawb_raw = parts[1]
                     customer = None
                     checkbook_hawbs = None
@@ -97,34 +123,30 @@ def parse_mawb_input(text: str) -> List[Dict[str, str]]:
                 customer = None
                 checkbook_hawbs = None
         # Check for comma-separated
-        elif ',' in line:
-            parts = [p.strip() for p in line.split(',')]
+        elif sep == ',':
+            parts = _COMMA_SPLIT_RE.split(line)
             checkbook_hawbs = None
             # Handle 5-column format: Port, Customer, Broker, HAWBs, Master
             if len(parts) >= 5:
-                # Find the MAWB (11 digits) - it should be the last column
+                # MAWB is the last column - normalize_mawb below rejects invalid values
                 mawb_raw = parts[4]
-                if re.search(r'\d{11}', mawb_raw):
-                    airport_code = parts[0] or None
-                    customer = parts[1] or None
-                    # Broker (parts[2]) is ignored - selected from dropdown
-                    checkbook_hawbs = parts[3] or None  # HAWBs at index 3
-                else:
-                    # Not a valid 5-column format, fall through to 3-column
-                    mawb_raw = None
+                airport_code = parts[0] or None
+                customer = parts[1] or None
+                # Broker (parts[2]) is ignored - selected from dropdown
+                checkbook_hawbs = parts[3] or None  # HAWBs at index 3
             elif len(parts) >= 3:
                 airport_code = parts[0] or None
                 customer = parts[1] or None
                 mawb_raw = parts[2]
             elif len(parts) == 2:
                 # Try to identify which is MAWB
-                if re.search(r'\d{11}', parts[0]):
+                if _MAWB_DIGITS_RE.search(parts[0]):
                     mawb_raw = parts[0]
-                    airport_code = parts[1] if parts[1] and not re.search(r'\d{11}', parts[1]) else None
+                    airport_code = parts[1] if parts[1] and not _MAWB_DIGITS_RE.search(parts[1]) else None
                     customer = None
                     checkbook_hawbs = None
-                elif re.search(r'\d{11}', parts[1]):
-                    airport_code = parts[0] if parts[0] and not re.search(r'\d{11}', parts[0]) else None
+                elif _MAWB_DIGITS_RE.search(parts[1]):
+                    airport_code = parts[0] if parts[0] and not _MAWB_DIGITS_RE.search(parts[0]) else None
                     mawb_raw = parts[1]
                     customer = None
                     checkbook_hawbs = None
@@ -135,14 +157,14 @@ def parse_mawb_input(text: str) -> List[Dict[str, str]]:
                 airport_code = None
                 customer = None
                 checkbook_hawbs = None
-        # Check for space-separated (multiple spaces or single space)
-        elif re.search(r'\s{2,}', line) or (line.count(' ') >= 2):
-            parts = [p.strip() for p in re.split(r'\s+', line)]
+        # Check for whitespace-separated
+        elif sep == ' ':
+            parts = [p.strip() for p in _WHITESPACE_SPLIT_RE.split(line)]
             # Try to find the MAWB (contains 11 digits)
             mawb_part = None
             mawb_idx = None
             for idx, part in enumerate(parts):
-                if re.search(r'\d{11}', part):
+                if _MAWB_DIGITS_RE.search(part):
                     mawb_part = part
                     mawb_idx = idx
                     break
@@ -186,8 +208,8 @@ def parse_mawb_input(text: str) -> List[Dict[str, str]]:
             normalized_mawb = normalize_mawb(mawb_raw)
             result_dict = {
                 "mawb": normalized_mawb,
-                "airport_code": airport_code if airport_code else None,
-                "customer": customer if customer else None,
+                "airport_code": airport_code or None,
+                "customer": customer or None,
             }
             if checkbook_hawbs is not None:
                 result_dict["checkbook_hawbs"] = checkbook_hawbs
@@ -6,7 +6,9 @@ from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, constr, field_validator, model_validator, validator
+from pydantic import BaseModel, ConfigDict, Field, conlist, constr, field_validator, model_validator, validator
+
+from .input_parser import normalize_mawb
 
 
 MAWBPattern = constr(pattern=r"^\d{11}$")
@@ -65,6 +67,8 @@ class BrokerUpdate(BaseModel):
 
 
 class BrokerResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
     id: UUID
     name: str
     username: str
@@ -98,6 +102,8 @@ class FormatUpdate(BaseModel):
 
 
 class FormatResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
     id: UUID
     name: str
     template_identifier: str
@@ -118,18 +124,12 @@ class DutySections(BaseModel):
 class DutyRunRequest(BaseModel):
     broker_id: UUID
     format_id: UUID
-    mawbs: List[str] = Field(..., min_items=1, max_items=100)
+    mawbs: conlist(str, min_length=1, max_length=100)
     sections: DutySections = DutySections()
 
     @validator("mawbs")
     def validate_mawbs(cls, items: List[str]) -> List[str]:
-        normalized: List[str] = []
-        for mawb in items:
-            digits = "".join(ch for ch in mawb if ch.isdigit())
-            if len(digits) != 11:
-                raise ValueError(f"MAWB value '{mawb}' must contain exactly 11 digits")
-            normalized.append(digits)
-        return normalized
+        return [normalize_mawb(mawb) for mawb in items]
 
 
 class DutyRunStatus(str):
@@ -151,6 +151,8 @@ class DutyRunStatusResponse(BaseModel):
 
 
 class DutyResultResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
     id: UUID
     mawb: str
     broker_id: UUID
@@ -185,18 +187,17 @@ class BatchItemCreate(BaseModel):
 
     @validator("mawb")
     def validate_mawb(cls, v: str) -> str:
-        digits = "".join(ch for ch in v if ch.isdigit())
-        if len(digits) != 11:
-            raise ValueError(f"MAWB must contain exactly 11 digits, found {len(digits)}")
-        return digits
+        return normalize_mawb(v)
 
 
 class BatchCreate(BaseModel):
     sections: DutySections = DutySections()
-    items: List[BatchItemCreate] = Field(..., min_items=1, description="List of MAWBs to process (each with broker_id/format_id)")
+    items: conlist(BatchItemCreate, min_length=1) = Field(..., description="List of MAWBs to process (each with broker_id/format_id)")
 
 
 class BatchItemResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
     id: UUID
     batch_id: UUID
     mawb: str
@@ -217,6 +218,8 @@ class BatchItemResponse(BaseModel):
 
 
 class BatchResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
     id: UUID
     batch_name: str
     sections: Dict[str, bool]
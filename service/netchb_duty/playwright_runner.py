@@ -3,23 +3,93 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
 import re
-import shutil
+import sys
+import time
+import traceback
+import types
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from openpyxl import load_workbook
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
-from .otp_manager import OTPManager
+try:
+    import orjson
+except ImportError:  # Optional speed-up - stdlib json is used otherwise
+    orjson = None
+
+try:
+    from fastnumbers import try_float
+except ImportError:  # Optional speed-up - float() with try/except is used otherwise
+    try_float = None
 
+from .otp_manager import OTPManager
 
+try:
+    from utils.playwright_launcher import get_container_safe_browser_args
+except ModuleNotFoundError as exc:
+    # Only a missing utils package means the app root is not importable - errors raised
+    # inside the launcher module itself must surface as they are
+    if exc.name not in ("utils", "utils.playwright_launcher"):
+        raise
+    # Fallback if the app root is not importable - load straight from the utils dir
+    _UTILS_DIR = Path(__file__).parent.parent.parent.resolve() / "utils"
+    if str(_UTILS_DIR) not in sys.path:
+        sys.path.insert(0, str(_UTILS_DIR))
+    from playwright_launcher import get_container_safe_browser_args
+
+
+def _cheap_stack(context: int = 1) -> List[Any]:
+    """``inspect.stack()`` without the per-frame source-file lookups (filename is co_filename)."""
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        frames.append(inspect.FrameInfo(frame, code.co_filename, frame.f_lineno, code.co_name, None, None))
+        frame = frame.f_back
+    return frames
+
+
+def _use_cheap_playwright_stacks() -> None:
+    """Give Playwright's connection module an ``inspect`` whose ``stack()`` is ``_cheap_stack``.
+
+    Playwright walks the caller's stack on every API call, only to name the call in traces and
+    error messages; the stock walk stats and reads source files for each frame. This patches a
+    private Playwright module for the whole process, so it is opt-in (see _launch_browser).
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:  # Private module moved in this Playwright version - leave it alone
+        return
+    stock = getattr(_connection, "inspect", None)
+    if stock is not inspect:
+        return
+    shim = types.ModuleType("inspect")
+    shim.__dict__.update(vars(inspect))
+    shim.stack = _cheap_stack
+    _connection.inspect = shim
+
+
+NETCHB_BASE_URL = "https://www.netchb.com"
 LOGIN_URL = "https://www.netchb.com/security/"
 AMS_SEARCH_URL = "https://www.netchb.com/app/ams/index.jsp"
 AMS_SEARCH_POST_URL = "https://www.netchb.com/app/ams/viewMawbs.do"
@@ -36,21 +106,448 @@ OTP_INPUT_SELECTOR = "#tfa"
 OTP_SUBMIT_SELECTOR = "#tfaForm > div:nth-child(2) > input[type=submit]"
 LOGIN_SUCCESS_SELECTOR = "#menuTableBody > tr > td:nth-child(1)"
 
+# Container-safe Chromium args plus the NetCHB window size, computed once per process
+_BROWSER_ARGS: Tuple[str, ...] = tuple(get_container_safe_browser_args()) + ("--window-size=1920,1080",)
+
+# Context-wide Playwright defaults (ms)
+DEFAULT_NAVIGATION_TIMEOUT_MS = 10000
+DEFAULT_ACTION_TIMEOUT_MS = 5000
+# Form submits and page loads wait on NetCHB server work (the site is slow), not just the DOM
+SUBMIT_TIMEOUT_MS = 60000
+
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1"
+)
+
+# Browser-like navigation headers for the HTTP form posts, built once; only Referer varies
+_HTTP_FORM_HEADERS: Mapping[str, str] = MappingProxyType({
+    "User-Agent": HTTP_USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Origin": "https://www.netchb.com",
+    "Referer": ENTRIES_URL,
+    "Cache-Control": "max-age=0",
+    "Connection": "keep-alive",
+    "DNT": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-User": "?1",
+    "Upgrade-Insecure-Requests": "1",
+})
+_AMS_HTTP_HEADERS: Mapping[str, str] = MappingProxyType({**_HTTP_FORM_HEADERS, "Referer": AMS_SEARCH_POST_URL})
+_CUSTOM_REPORT_HTTP_HEADERS: Mapping[str, str] = MappingProxyType({
+    **_HTTP_FORM_HEADERS,
+    "User-Agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Mobile Safari/537.36",
+    "Referer": CUSTOM_REPORT_URL,
+})
+# Plain GET of the AMS master page linked from the search results
+_AMS_MASTER_GET_HEADERS: Mapping[str, str] = MappingProxyType({
+    "User-Agent": _AMS_HTTP_HEADERS["User-Agent"],
+    "Accept": _AMS_HTTP_HEADERS["Accept"],
+    "Referer": AMS_SEARCH_POST_URL,
+})
+_SESSION_PROBE_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+})
+
+# Static search form fields; callers overlay the MAWB (placeholder keys keep the field order)
+_AMS_SEARCH_FORM: Mapping[str, str] = MappingProxyType({
+    "prefix": "",
+    "mawb": "",
+    "refNo": "",
+    "hawb": "",
+    "arrivalBegin": "",
+    "arrivalEnd": "",
+    "container": "",
+    "cbpStatus": "",
+    "acasStatus": "",
+    "arrivalAirport": "",
+    "carrier": "",
+    "flight": "",
+    "client": "0",
+    "clientName": "",
+    "searchByProfile": "true",
+    "searchTimePeriod": "Y1",
+    "location": "0",  # All Locations
+    "user": "",  # All Users
+    "noPerPage": "25",
+    "cfs": "false",
+    "pageNo": "0",
+    "orderBy": "amb1",
+})
+# Matches the network capture of the Entries search (masterBill is the full 11-digit MAWB)
+_ENTRIES_SEARCH_FORM: Mapping[str, str] = MappingProxyType({
+    "entryNoSearch": "",
+    "brokerRefNo": "",
+    "importerRecord": "0",
+    "importerRecordName": "",
+    "importerSearchByProfile": "true",
+    "ultimateConsignee": "0",
+    "ultimateConsigneeName": "",
+    "ultimateConsigneeSearchByProfile": "true",
+    "freightForwarder": "0",
+    "freightForwarderName": "",
+    "freightForwarderSearchByProfile": "true",
+    "begin": "",
+    "end": "",
+    "entryStatus": "",
+    "cargoReleaseStatus": "",
+    "manifestStatus": "",
+    "pgaAgency": "",
+    "ogaStatus": "",
+    "statusColor": "",
+    "entryType": "",
+    "portEntry": "",
+    "modeTransport": "",
+    "masterBill": "",
+    "searchTimePeriod": "Y1",  # 1 Year
+    "user": "",  # All Users (empty string)
+    "location": "0",  # All Locations
+    "noPerPage": "1000",  # Show 1000 per page
+    "entryNo": "0",
+    "orderBy": "vep1",  # Order by Entry No
+})
+_ENTRIES_VIEW_FORM: Mapping[str, str] = MappingProxyType({
+    **_ENTRIES_SEARCH_FORM,
+    "page": "0",
+    "unchecked7501": "",
+    "unchecked3461": "",
+    "method": "view",
+})
+
+# Page markers for session validation: login form username field vs AMS prefix field
+_LOGIN_MARKER_RE = re.compile(rb"""\bid\s*=\s*(?:"lName"|'lName'|lName[\s/>])""")
+# Stop reading the session probe body once this much HTML has been scanned without a marker
+SESSION_PROBE_MAX_BYTES = 16 * 1024
+
+_AMS_MARKER_RE = re.compile(rb"""\bid\s*=\s*(?:"pre"|'pre'|pre[\s/>])""")
+
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+# Entry link query string ("filerCode=...&entryNo=...") and the AMS master id in a link/URL
+_ENTRY_QS_RE = re.compile(r"filerCode=[^&]+&entryNo=\d+")
+_AMS_MAWB_RE = re.compile(r"amsMawbId=([^&]*)")
+_ENTRY_NO_RE = re.compile(r"entryNo=(\d+)")
+# Cheap MM/DD/YY shape check so strptime only runs on cells that can actually be dates
+_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2}")
+# AMS search "There is no awb" message; matched on the raw HTML instead of the lowercased page text
+_NO_AWB_RE = re.compile(r"no awb", re.IGNORECASE)
+_NO_AWB_BYTES_RE = re.compile(rb"no awb", re.IGNORECASE)
+
+
+# Runner log lines are echoed to stdout from a background thread so console writes
+# never block automation; the runner itself only records (timestamp, message) pairs.
+_console_logger = logging.getLogger(f"{__name__}.console")
+_console_logger.propagate = False
+_console_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _echo_to_console(message: str) -> None:
+    global _console_listener
+    if _console_listener is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(
+            logging.Formatter("[%(asctime)s.%(msecs)03d] %(message)s", datefmt="%H:%M:%S")
+        )
+        _console_listener = logging.handlers.QueueListener(log_queue, console_handler)
+        _console_listener.start()
+        atexit.register(_console_listener.stop)
+        _console_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _console_logger.setLevel(logging.INFO)
+    _console_logger.info(message)
+
+
+# Summary keys in output order; every value starts as "N/A" until a section fills it in
+_SUMMARY_TEMPLATE: Dict[str, str] = dict.fromkeys(
+    (
+        "MAWB Number",
+        "AMS Total HAWBs",
+        "AMS Duty",
+        "AMS Total T-11 Entries",
+        "AMS Entries Accepted",
+        "Rejected Entries",
+        "7501 Total T-11 Entries",
+        "7501 Total Houses",
+        "7501 Duty",
+        "Report Duty",
+        "Report Total House",
+        "Total Informal Duty",
+        "Complete Total Duty",
+        "Entry Date",
+        "Cargo Release Date",
+        "7501 Batch PDF URL",
+        "Checkbook HAWBs",
+    ),
+    "N/A",
+)
+
+
+_MONEY_TABLE = str.maketrans("", "", "$,")
+# Thousands separators in AMS counts ("3,690"); int() already ignores surrounding whitespace
+_COMMA_STRIP = str.maketrans("", "", ",")
+# Browser path: trimmed innerText of the first match of each selector under the element
+# (null when absent), read and trimmed in the page in a single round-trip
+_INNER_TEXTS_JS = """(root, selectors) => selectors.map(selector => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+})"""
+# AMS search results: [row count, HAWBs, arrival, has master link, master href] of the first row
+_AMS_FIRST_ROW_JS = """rows => {
+    const first = rows[0];
+    if (!first) return [0, null, null, false, null];
+    const text = selector => {
+        const el = first.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    };
+    const link = first.querySelector("td:nth-child(1) > a");
+    return [rows.length, text("td:nth-child(7)"), text("td:nth-child(6)"), link !== null,
+            link ? link.getAttribute("href") : null];
+}"""
+
+# Summary values compared by the PDF verification before download and after extraction
+_INITIAL_VERIFICATION_KEYS = (
+    "AMS Total HAWBs",
+    "7501 Total Houses",
+    "Report Total House",
+    "Checkbook HAWBs",
+    "Rejected Entries",
+    "AMS Duty",
+    "Report Duty",
+)
+# Only the values the PDF step adds; AMS/Report duty are reused from the initial check
+_FINAL_VERIFICATION_KEYS = (
+    "7501 Duty",
+    "AMS Total T-11 Entries",
+    "7501 Total T-11 Entries",
+)
+
+
+def _parse_money(val) -> float:
+    """Parse a summary value such as "$1,234.50" or "12" to a number (0 if missing or invalid)."""
+    if val is None:
+        return 0
+    if isinstance(val, (int, float)):
+        return float(val)
+    return _parse_money_text(str(val))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_money_text(text: str) -> float:
+    cleaned = text.translate(_MONEY_TABLE).strip()
+    if try_float is not None:
+        return try_float(cleaned, on_fail=0)
+    try:
+        return float(cleaned)
+    except ValueError:
+        return 0
+
+
+def _parse_count(text: str) -> Optional[int]:
+    """Integer count from AMS text such as "3,690": 0 when blank, None when not an integer.
+
+    Validated with ``isdecimal`` (the characters ``int`` accepts) so bad input never raises.
+    """
+    cleaned = text.translate(_COMMA_STRIP).strip()
+    if not cleaned:
+        return 0
+    unsigned = cleaned[1:] if cleaned[0] in "+-" else cleaned
+    return int(cleaned) if unsigned.isdecimal() else None
+
 
 def _normalize_mawb(mawb: str) -> str:
-    digits = "".join(ch for ch in mawb if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", mawb)
     if len(digits) != 11:
         raise ValueError(f"MAWB '{mawb}' must contain exactly 11 digits")
     return digits
 
 
 def _format_excel_date(value) -> str:
-    try:
-        if isinstance(value, datetime):
+    if isinstance(value, datetime):
+        try:
             return value.strftime("%m/%d/%y")
-        return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S").strftime("%m/%d/%y")
+        except Exception:
+            return str(value)
+    return _format_excel_date_text(str(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_excel_date_text(text: str) -> str:
+    # Report rows repeat the same few dates, so each distinct string is parsed once
+    try:
+        return datetime.strptime(text, "%Y-%m-%d %H:%M:%S").strftime("%m/%d/%y")
     except Exception:
-        return str(value)
+        return text
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_mmddyy(text: str) -> datetime:
+    # Entry rows of one MAWB share a handful of dates; invalid text raises ValueError uncached
+    return datetime.strptime(text, "%m/%d/%y")
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name`` (CSS ``.name``)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Result pages are parsed with lxml (C parser, XPath evaluated in C) rather than BeautifulSoup.
+# The parser and every XPath below are built once per process and shared by all runners.
+_HTML_PARSER = lxml_html.HTMLParser(recover=True, no_network=True)
+
+_ROWS_XPATH = etree.XPath(".//tr")
+_CELLS_XPATH = etree.XPath(".//td")
+_DIVS_XPATH = etree.XPath(".//div")
+_FIRST_LINK_XPATH = etree.XPath("descendant::a[1]")
+_FIRST_TBODY_XPATH = etree.XPath("descendant::tbody[1]")
+_DATA_ROW_CLASSES = frozenset(("light", "dark"))
+# First result row of AMS search: #resultsDiv, its first table/tbody, then tr.light/tr.dark
+_AMS_ROWS_XPATH = etree.XPath(
+    "(//div[@id='resultsDiv'])[1]/descendant::table[1]/descendant::tbody[1]"
+    f"/descendant::tr[{_has_class('light')} or {_has_class('dark')}]"
+)
+_AMS_MAWB_LINK_XPATH = etree.XPath("descendant::td[1]/descendant::a[1]")
+# AMS master page summary cells: #esH (7501 houses), #esD (duty), #esC (T-11), #esA (accepted)
+_AMS_SUMMARY_IDS = frozenset(("esH", "esD", "esC", "esA"))
+_PULL_PARSE_CHUNK = 64 * 1024
+# Pages at least this big also have finished elements cleared while pull-parsing
+_PULL_PARSE_CLEAR_MIN_BYTES = 256 * 1024
+# Entries results table
+_HEADER_ROWS_XPATH = etree.XPath(f".//tr[{_has_class('header')}]")
+# Header cells whose text, lowercased with whitespace removed, contains "entrydate"
+_ENTRY_DATE_CELLS_XPATH = etree.XPath(
+    ".//td[contains(translate(., 'ADENRTY \t\r\n', 'adenrty'), 'entrydate')]"
+)
+_ENTRIES_TABLE_XPATH = etree.XPath(f"//*[@id='veForm']/div[{_has_class('dataCell')}]/table")
+_ENTRIES_TABLE_FALLBACK_XPATH = etree.XPath(f"//div[{_has_class('dataCell')}]/table")
+# Browser path: the results table's inner HTML re-wrapped in <table> (the CSS
+# "table > tbody tr.light, table > tbody tr.dark"), and td:nth-child($n) of a row
+_ENTRIES_DATA_ROWS_XPATH = etree.XPath(
+    f"(//table)[1]/tbody//tr[{_has_class('light')} or {_has_class('dark')}]"
+)
+_NTH_CELL_XPATH = etree.XPath("*[$n][self::td]")
+_INV_ROW_COUNT_XPATH = etree.XPath("count((//tbody[@id='invBdy'])[1]//tr)")
+# #pForm > div:nth-child(1) > div:nth-child(2) > div > div.content > table, else the
+# div.formContainerWithLabel > div.content > table fallback (only when the first is absent)
+_DUTY_TABLE_PRIMARY = (
+    f"//*[@id='pForm']/*[1][self::div]/*[2][self::div]/div/div[{_has_class('content')}]/table"
+)
+_DUTY_TABLE_XPATH = etree.XPath(
+    f"{_DUTY_TABLE_PRIMARY}"
+    f" | (//div[{_has_class('formContainerWithLabel')}]/div[{_has_class('content')}]/table)"
+    f"[not({_DUTY_TABLE_PRIMARY})]"
+)
+# Rows of the first tbody, or of the table itself when it has no tbody
+_DUTY_ROWS_XPATH = etree.XPath("descendant::tbody[1]//tr | self::table[not(descendant::tbody)]//tr")
+
+
+def _absolute_url(href: str) -> str:
+    """Resolve a result-page href against NetCHB (site-relative paths are a plain concat)."""
+    if href.startswith("/"):
+        if href.startswith("//"):  # Protocol-relative - let urljoin supply the scheme
+            return urljoin(NETCHB_BASE_URL, href)
+        return NETCHB_BASE_URL + href
+    return href
+
+
+@functools.lru_cache(maxsize=None)
+def _html_parser_for(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """Shared parser that decodes raw response bytes as ``encoding`` (the response charset)."""
+    if encoding is None:
+        return _HTML_PARSER
+    return lxml_html.HTMLParser(recover=True, no_network=True, encoding=encoding)
+
+
+def _parse_html(html: Union[str, bytes], encoding: Optional[str] = None):
+    """Parse an HTML page with the shared lxml parser; returns None for an empty body.
+
+    Response bodies are passed as bytes with httpx's ``response.encoding`` so libxml2 decodes
+    them in C, the same way ``response.text`` would have.
+    """
+    if not html or not html.strip():
+        return None
+    return lxml_html.document_fromstring(html, parser=_html_parser_for(encoding))
+
+
+def _find_elements_by_id(
+    html: Union[str, bytes], ids: frozenset, encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """First element for each id in ``ids`` (document order, like ``soup.find(id=...)``).
+
+    The page is fed to a pull parser in chunks and parsing stops as soon as every id has
+    been seen and closed, so the rest of the page is never built. On large pages every other
+    element is cleared once it ends, so memory stays flat up to the last id.
+    """
+    parser = etree.HTMLPullParser(
+        events=("start", "end"), recover=True, no_network=True, encoding=encoding
+    )
+    found: Dict[str, Any] = {}
+    open_ids: set = set()
+    # Ancestors of found elements; clearing one of them would drop the found subtree
+    keep: set = set()
+    clear_ended = len(html or "") >= _PULL_PARSE_CLEAR_MIN_BYTES
+
+    def consume() -> bool:
+        for event, elem in parser.read_events():
+            elem_id = elem.get("id")
+            if elem_id not in ids:
+                # Descendants of an open found element are part of its text; keep them
+                if clear_ended and event == "end" and not open_ids and elem not in keep:
+                    elem.clear(keep_tail=True)
+                continue
+            if event == "start":
+                if elem_id not in found:
+                    found[elem_id] = elem
+                    open_ids.add(elem_id)
+                    if clear_ended:
+                        keep.update(elem.iterancestors())
+            elif found.get(elem_id) is elem:
+                open_ids.discard(elem_id)
+        return len(found) == len(ids) and not open_ids
+
+    for offset in range(0, len(html or ""), _PULL_PARSE_CHUNK):
+        parser.feed(html[offset:offset + _PULL_PARSE_CHUNK])
+        if consume():
+            return found
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:  # Nothing was fed
+        return found
+    consume()
+    return found
+
+
+def _find_entry_date_column(header_row) -> Optional[Tuple[int, str]]:
+    """(0-based column, header text) of the "Entry Date" cell in a results header row.
+
+    The XPath narrows the row to cells mentioning Entry Date in C; the text check then applies
+    the original rule (a non-empty nested div's text wins over the cell text).
+    """
+    for cell in _ENTRY_DATE_CELLS_XPATH(header_row):
+        header_text = _text(cell)
+        # Some headers wrap the label in a div, e.g. <div id="eDte_ob">Entry Date</div>
+        for div in _DIVS_XPATH(cell):
+            div_text = _text(div)
+            if div_text:
+                header_text = div_text
+                break
+        header_text_lower = header_text.lower()
+        if "entry date" in header_text_lower or "entrydate" in header_text_lower.replace(" ", ""):
+            return _CELLS_XPATH(header_row).index(cell), header_text
+    return None
+
+
+def _first(elements):
+    return elements[0] if elements else None
+
+
+def _text(element) -> str:
+    """Text of an lxml element, equivalent to BeautifulSoup's ``get_text(strip=True)``."""
+    return "".join(chunk.strip() for chunk in element.itertext())
 
 
 @dataclass
@@ -64,10 +561,25 @@ class DutyRunResult:
         return self.summary
 
 
+@dataclass(slots=True)
+class EntryRow:
+    """One row of the Entries search results (reused by the 7501 batch PDF download)."""
+
+    date: Optional[datetime]
+    date_text: Optional[str]
+    link: Optional[str]
+    query_string: Optional[str]
+
+
 class NetChbDutyRunner:
     """Wraps Playwright automation for NetCHB duties."""
 
-    def __init__(self, *, headless: bool = True, download_root: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        *,
+        headless: bool = True,
+        download_root: Optional[Path] = None,
+    ) -> None:
         self.headless = headless
         self.download_root = download_root or Path.cwd() / "temp_netchb_downloads"
         self.download_root.mkdir(parents=True, exist_ok=True)
@@ -75,19 +587,29 @@ class NetChbDutyRunner:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._http: Optional[httpx.AsyncClient] = None  # Shared keep-alive client for HTTP probes
         self.temp_dir = TemporaryDirectory()
-        self._logs: List[str] = []
-        self._last_entry_rows: Optional[List[Dict]] = None  # Store entry_rows for PDF download reuse
+        self._logs: deque[Tuple[int, str]] = deque()  # (time_ns, message), formatted on read
+        self._last_entry_rows: Optional[List[EntryRow]] = None  # Store entry_rows for PDF download reuse
+        self._calculated_expiry: Optional[float] = None  # Earliest cookie expiry of the current session
+        self._storage_state_cache: Optional[Dict[str, Any]] = None
+        self._storage_state_dirty = True  # Set whenever the browser may have received new cookies
+        # (storage_state, cookies) of the last conversion; holds the reference so identity stays valid
+        self._cookie_cache: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
+        self._background_tasks: set = set()  # Keeps fire-and-forget tasks referenced until done
+        # Per-row parser diagnostics are only logged when NETCHB_DUTY_VERBOSE_LOGS=1
+        self._verbose = os.getenv("NETCHB_DUTY_VERBOSE_LOGS", "0") == "1"
 
     def log(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        entry = f"[{timestamp}] {message}"
-        self._logs.append(entry)
-        print(entry)  # Also print for immediate visibility
+        self._logs.append((time.time_ns(), message))
+        _echo_to_console(message)  # Also echo for immediate visibility
 
     @property
     def logs(self) -> List[str]:
-        return list(self._logs)
+        return [
+            f"[{datetime.fromtimestamp(timestamp_ns / 1e9).strftime('%H:%M:%S.%f')[:-3]}] {message}"
+            for timestamp_ns, message in self._logs
+        ]
 
     async def __aenter__(self) -> "NetChbDutyRunner":
         await self._setup_browser()
@@ -96,55 +618,82 @@ class NetChbDutyRunner:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.cleanup()
 
-    async def _setup_browser(self) -> None:
-        import time
-        setup_start = time.time()
-        
-        self.log("STEP 1: Initializing Playwright browser...")
+    @staticmethod
+    async def _launch_browser(
+        headless: bool, log, downloads_path: Optional[Path] = None
+    ) -> Tuple[Any, Browser]:
+        log("STEP 1: Initializing Playwright browser...")
         step_start = time.time()
-        self.playwright = await async_playwright().start()
-        self.log(f"STEP 1: Playwright initialized ({time.time() - step_start:.2f}s)")
-        
-        self.log("STEP 2: Launching Chromium browser (headless={})...".format(self.headless))
+        # NETCHB_DUTY_PW_CHEAP_STACKS=1 opts into the lighter Playwright call-site capture
+        if os.getenv("NETCHB_DUTY_PW_CHEAP_STACKS", "0") == "1":
+            _use_cheap_playwright_stacks()
+        playwright = await async_playwright().start()
+        log(f"STEP 1: Playwright initialized ({time.time() - step_start:.2f}s)")
+
+        log("STEP 2: Launching Chromium browser (headless={})...".format(headless))
         step_start = time.time()
-        # Use container-safe browser args
-        import sys
-        from pathlib import Path
-        
-        # Add app utils to path for imports
-        _app_dir = Path(__file__).parent.parent.parent.resolve()
-        _utils_dir = _app_dir / "utils"
-        if str(_utils_dir) not in sys.path:
-            sys.path.insert(0, str(_utils_dir))
-        
-        from playwright_launcher import get_container_safe_browser_args
-        base_args = get_container_safe_browser_args()
-        # Add window size for NetCHB
-        extra_args = ["--window-size=1920,1080"]
-        all_args = base_args + extra_args
-        
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=all_args,
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            args=list(_BROWSER_ARGS),
+            downloads_path=downloads_path,
         )
-        self.log(f"STEP 2: Browser launched ({time.time() - step_start:.2f}s)")
+        log(f"STEP 2: Browser launched ({time.time() - step_start:.2f}s)")
+        return playwright, browser
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with this runner's download handling and timeouts."""
+        if not self.browser:
+            raise RuntimeError("Browser not initialized")
 
         self.log("STEP 3: Creating browser context with download settings...")
         step_start = time.time()
-        download_dir = Path(self.temp_dir.name)
-        self.context = await self.browser.new_context(
+        context = await self.browser.new_context(
             viewport={"width": 1920, "height": 1080},
             accept_downloads=True,
         )
+        # Fail fast by default; known-slow pages and downloads pass explicit timeouts
+        context.set_default_navigation_timeout(DEFAULT_NAVIGATION_TIMEOUT_MS)
+        context.set_default_timeout(DEFAULT_ACTION_TIMEOUT_MS)
+        # Any browser response may set cookies, so it invalidates the cached storage state
+        context.on("response", self._mark_storage_state_dirty)
         self.log(f"STEP 3: Context created ({time.time() - step_start:.2f}s)")
 
         self.log("STEP 4: Setting up download handling...")
-        async def handle_download(download):
+        def handle_download(download):
             self.log(f"Download started: {download.suggested_filename}")
-            path = await download.path()
-            self.log(f"Download saved to: {path}")
+            # download.path() resolves only once the file is fully saved - log it in the background
+            task = asyncio.create_task(self._log_download_path(download))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        context.on("download", handle_download)
+        return context
+
+    @staticmethod
+    def _new_http_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            headers={"User-Agent": HTTP_USER_AGENT},
+        )
+
+    async def _log_download_path(self, download) -> None:
+        try:
+            self.log(f"Download saved to: {await download.path()}")
+        except Exception as exc:
+            self.log(f"Download failed: {exc}")
+
+    async def _setup_browser(self) -> None:
+        setup_start = time.time()
 
-        self.context.on("download", handle_download)
+        # Downloads go straight to our temp dir instead of being copied out of Playwright's
+        self.playwright, self.browser = await self._launch_browser(
+            self.headless, self.log, downloads_path=Path(self.temp_dir.name)
+        )
+        self.context = await self._new_context()
+
+        # One long-lived HTTP client so repeated probes reuse the TLS connection
+        self._http = self._new_http_client()
 
         self.log("STEP 5: Creating new page...")
         step_start = time.time()
@@ -157,6 +706,13 @@ class NetChbDutyRunner:
     async def cleanup(self) -> None:
         self.log("CLEANUP: Closing browser and cleaning up...")
         try:
+            # Pending download-path loggers would only report the context closing under them
+            if self._background_tasks:
+                tasks = list(self._background_tasks)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self.log(f"CLEANUP: Cancelled {len(tasks)} pending background task(s)")
             if self.page:
                 await self.page.close()
                 self.log("CLEANUP: Page closed")
@@ -169,6 +725,9 @@ class NetChbDutyRunner:
             if self.playwright:
                 await self.playwright.stop()
                 self.log("CLEANUP: Playwright stopped")
+            if self._http:
+                await self._http.aclose()
+                self.log("CLEANUP: HTTP client closed")
         except Exception as exc:
             self.log(f"CLEANUP ERROR: {exc}")
         finally:
@@ -176,9 +735,32 @@ class NetChbDutyRunner:
             self.context = None
             self.browser = None
             self.playwright = None
+            self._http = None
             self.temp_dir.cleanup()
             self.log("CLEANUP: Complete")
 
+    async def _wait_for_first_selector(
+        self, page: Page, selectors: List[str], timeout: Optional[float] = None, state: str = "visible"
+    ) -> Optional[str]:
+        """Race several selectors and return the first one that appears (None if none do)."""
+        waiters = {
+            asyncio.ensure_future(page.wait_for_selector(selector, timeout=timeout, state=state)): selector
+            for selector in selectors
+        }
+        try:
+            pending = set(waiters)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return waiters[task]
+            return None
+        finally:
+            for task in waiters:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+
     # ------------------------------------------------------------------
     # Login
     # ------------------------------------------------------------------
@@ -191,41 +773,41 @@ class NetChbDutyRunner:
         self.log("=" * 60)
 
         self.log(f"STEP 1: Navigating to login URL: {LOGIN_URL}")
-        await self.page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=30000)
+        await self.page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=SUBMIT_TIMEOUT_MS)
         self.log(f"STEP 1: Page loaded. Current URL: {self.page.url}")
 
-        self.log("STEP 2: Waiting for username field (#lName)...")
-        await self.page.wait_for_selector("#lName", timeout=20000)
-        self.log("STEP 2: Username field found")
-
-        self.log(f"STEP 3: Filling username field with: {username}")
+        # fill() waits for the field to be actionable, so no separate wait_for_selector
+        self.log(f"STEP 2-3: Filling username field (#lName) with: {username}")
         await self.page.fill("#lName", username)
-        self.log("STEP 3: Username filled")
+        self.log("STEP 2-3: Username filled")
 
         self.log("STEP 4: Filling password field (#pass)...")
         await self.page.fill("#pass", password)
         self.log("STEP 4: Password filled")
 
         self.log("STEP 5: Clicking login submit button...")
-        await self.page.click("input[type=submit]")
+        await self.page.click("input[type=submit]", timeout=SUBMIT_TIMEOUT_MS)
         self.log("STEP 5: Login button clicked")
 
         self.log("STEP 6: Waiting for page response (either 2FA or dashboard)...")
-        await self.page.wait_for_timeout(2000)  # Give page time to respond
+        await self.page.wait_for_load_state("domcontentloaded", timeout=SUBMIT_TIMEOUT_MS)
+        landed_on = await self._wait_for_first_selector(
+            self.page, [OTP_INPUT_SELECTOR, LOGIN_SUCCESS_SELECTOR], timeout=8000
+        )
+        self.log(f"STEP 6: Page responded ({landed_on or 'no 2FA or dashboard selector yet'})")
 
         # Check if 2FA is required
-        if otp_uri:
+        if otp_uri and landed_on == LOGIN_SUCCESS_SELECTOR:
+            self.log("STEP 7-12: Already logged in - 2FA not required for this broker")
+        elif otp_uri:
             self.log("=" * 60)
             self.log("2FA AUTHENTICATION REQUIRED")
             self.log("=" * 60)
 
             self.log("STEP 7: Checking for 2FA input field (#tfa)...")
             try:
-                await self.page.wait_for_selector(
-                    OTP_INPUT_SELECTOR,
-                    timeout=10000,
-                    state="visible"
-                )
+                if landed_on != OTP_INPUT_SELECTOR:
+                    await self.page.wait_for_selector(OTP_INPUT_SELECTOR, state="visible")
                 self.log("STEP 7: 2FA input field found - authentication required")
 
                 self.log("STEP 8: Generating fresh TOTP code from OTP URI...")
@@ -239,20 +821,14 @@ class NetChbDutyRunner:
                 await self.page.fill(OTP_INPUT_SELECTOR, otp_code)
                 self.log("STEP 9: 2FA code filled")
 
-                self.log("STEP 10: Waiting for 2FA submit button...")
-                await self.page.wait_for_selector(
-                    OTP_SUBMIT_SELECTOR,
-                    timeout=5000,
-                    state="visible"
-                )
-                self.log("STEP 10: 2FA submit button found")
-
-                self.log("STEP 11: Clicking 2FA submit button...")
-                await self.page.click(OTP_SUBMIT_SELECTOR)
-                self.log("STEP 11: 2FA submit button clicked")
+                # click() waits for the button itself; wait on the resulting navigation
+                # rather than a fixed delay
+                self.log("STEP 10-11: Clicking 2FA submit button...")
+                async with self.page.expect_navigation(wait_until="domcontentloaded", timeout=15000):
+                    await self.page.click(OTP_SUBMIT_SELECTOR)
+                self.log("STEP 10-11: 2FA submit button clicked")
 
-                self.log("STEP 12: Waiting for 2FA submission to process...")
-                await self.page.wait_for_timeout(2000)
+                self.log(f"STEP 12: 2FA submitted - navigated to {self.page.url}")
 
             except Exception as exc:
                 self.log(f"STEP 7-12 ERROR: 2FA process failed - {exc}")
@@ -271,7 +847,6 @@ class NetChbDutyRunner:
             self.log("STEP 13: Login success confirmed - dashboard menu found")
         except Exception as exc:
             current_url = self.page.url
-            page_content = await self.page.content()
             self.log(f"STEP 13 ERROR: Login confirmation failed")
             self.log(f"STEP 13 ERROR: Current URL: {current_url}")
             self.log(f"STEP 13 ERROR: Page title: {await self.page.title()}")
@@ -284,6 +859,22 @@ class NetChbDutyRunner:
     # ------------------------------------------------------------------
     # Session Management
     # ------------------------------------------------------------------
+    def _mark_storage_state_dirty(self, _response=None) -> None:
+        self._storage_state_dirty = True
+
+    async def _get_storage_state(self) -> Dict[str, Any]:
+        """
+        Return the context storage state, reusing the last snapshot while nothing
+        in the browser could have changed it (HTTP-only sections never touch the
+        browser cookie jar).
+        """
+        if not self.context:
+            raise RuntimeError("Context not initialized")
+        if self._storage_state_cache is None or self._storage_state_dirty:
+            self._storage_state_cache = await self.context.storage_state()
+            self._storage_state_dirty = False
+        return self._storage_state_cache
+
     async def save_session_state(self) -> Dict[str, Any]:
         """
         Save current browser context state (cookies + localStorage).
@@ -296,7 +887,7 @@ class NetChbDutyRunner:
             raise RuntimeError("Context not initialized")
         
         self.log("Saving browser session state (cookies + storage)...")
-        state = await self.context.storage_state()
+        state = dict(await self._get_storage_state())  # Copy - the hint below must not leak into the cache
         
         # Extract earliest cookie expiry from actual cookies
         earliest_expiry = None
@@ -305,22 +896,18 @@ class NetChbDutyRunner:
             # Get all cookie expiry timestamps, filtering out invalid values
             # Session cookies have expires: -1 or very old dates (before 1970)
             # We only want valid future expiry dates
-            from datetime import datetime, timezone
             now_timestamp = datetime.now(timezone.utc).timestamp()
             
-            expiry_timestamps = []
-            for cookie in cookies:
-                expires = cookie.get("expires")
-                if expires is not None:
-                    # Filter out invalid expiry values:
-                    # - Negative values (session cookies: -1)
-                    # - Very old dates (before 1970, which is timestamp 0)
-                    # - Only accept future dates (expires > now)
-                    if expires > 0 and expires > now_timestamp:
-                        expiry_timestamps.append(expires)
+            earliest_expiry = min(
+                (
+                    expires
+                    for cookie in cookies
+                    if (expires := cookie.get("expires")) is not None and expires > now_timestamp
+                ),
+                default=None,
+            )  # Unix timestamp (seconds)
             
-            if expiry_timestamps:
-                earliest_expiry = min(expiry_timestamps)  # Unix timestamp (seconds)
+            if earliest_expiry is not None:
                 # Convert to datetime for logging
                 expiry_dt = datetime.fromtimestamp(earliest_expiry, tz=timezone.utc)
                 self.log(f"Earliest cookie expires at: {expiry_dt}")
@@ -329,26 +916,32 @@ class NetChbDutyRunner:
         
         # Store the calculated expiry in the state for convenience
         state["_calculated_expiry"] = earliest_expiry
+        self._calculated_expiry = earliest_expiry
         
         self.log("Session state saved successfully")
         return state
 
-    async def load_session_state(self, state: Dict[str, Any]) -> None:
+    async def load_session_state(self, state: Union[Dict[str, Any], bytes]) -> None:
         """
         Load saved browser context state (cookies + localStorage).
         
         Args:
-            state: Dictionary from save_session_state() containing cookies and origins
+            state: Dictionary from save_session_state() containing cookies and origins,
+                or the same state as serialized JSON bytes
         """
         if not self.context:
             raise RuntimeError("Context not initialized")
         
+        if isinstance(state, (bytes, bytearray)):
+            state = orjson.loads(state) if orjson is not None else json.loads(state)
+        
         self.log("Loading saved browser session state...")
         
         # Load cookies
         cookies = state.get("cookies", [])
         if cookies:
             await self.context.add_cookies(cookies)
+            self._mark_storage_state_dirty()
             self.log(f"Loaded {len(cookies)} cookies from saved session")
         else:
             self.log("No cookies found in saved session state")
@@ -356,8 +949,46 @@ class NetChbDutyRunner:
         # Note: localStorage/IndexedDB restoration would require navigating to the domain first
         # For now, cookies are sufficient for NetCHB session persistence
         
+        self._calculated_expiry = state.get("_calculated_expiry")
+        
         self.log("Session state loaded successfully")
 
+    async def _probe_session_page(
+        self, client: httpx.AsyncClient, headers: Mapping[str, str]
+    ) -> Tuple[int, str, bytes]:
+        """
+        Fetch just enough of the AMS search page to tell whether the session is alive.
+
+        Redirects are followed manually so a redirect to the login page ends the probe
+        without downloading any body; otherwise the body is streamed only until a
+        login/AMS marker shows up (or SESSION_PROBE_MAX_BYTES have been read).
+
+        Returns:
+            Tuple of (status_code, final_url, html_head)
+        """
+        url = AMS_SEARCH_URL
+        for _ in range(5):
+            async with client.stream("GET", url, headers=headers, follow_redirects=False) as response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers.get("location", ""))
+                    if "security" in url.lower() or "login" in url.lower():
+                        return response.status_code, url, b""
+                    continue
+
+                html_head = b""
+                if response.status_code == 200:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        html_head += chunk
+                        if (
+                            _LOGIN_MARKER_RE.search(html_head)
+                            or _AMS_MARKER_RE.search(html_head)
+                            or len(html_head) >= SESSION_PROBE_MAX_BYTES
+                        ):
+                            break
+                return response.status_code, url, html_head
+
+        raise RuntimeError(f"Too many redirects while probing session page (last URL: {url})")
+
     async def is_session_valid(self) -> bool:
         """
         Check if current session is still valid by accessing a protected page (AMS).
@@ -366,70 +997,67 @@ class NetChbDutyRunner:
         
         This validates session works for actual operations, not just cookie existence.
         """
-        import time
         validation_start = time.time()
         
         self.log("Validating session by accessing protected page (AMS)...")
         
         # Try HTTP validation first (much faster - ~1-2s vs ~5-7s)
         try:
-            if self.context:
-                storage_state = await self.context.storage_state()
+            if self.context and self._http:
+                storage_state = await self._get_storage_state()
                 session_cookies = self._load_cookies_from_storage_state(storage_state)
                 
                 if session_cookies:
                     self.log("Using HTTP method for session validation (faster)...")
                     http_start = time.time()
-                    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                        # Set cookies
-                        for name, value in session_cookies.items():
-                            client.cookies.set(name, value, domain=".netchb.com")
+                    client = self._http
+                    # Set cookies (overwrites any left over from a previous probe)
+                    for name, value in session_cookies.items():
+                        client.cookies.set(name, value, domain=".netchb.com")
+                    
+                    # Try to access AMS search page
+                    status_code, final_url, html_bytes = await self._probe_session_page(
+                        client, headers=_SESSION_PROBE_HEADERS
+                    )
+                    
+                    http_time = time.time() - http_start
+                    self.log(f"HTTP request completed in {http_time:.2f}s")
+                    
+                    # Check if we're redirected to login page
+                    if 300 <= status_code < 400:
+                        self.log(f"Session is invalid - redirected to login page (HTTP check: {final_url})")
+                        validation_time = time.time() - validation_start
+                        self.log(f"❌ Session validation failed in {validation_time:.2f}s")
+                        return False
+                    
+                    if status_code == 200:
+                        # Scan the start of the HTML to check if we're on login page or AMS page
                         
-                        # Try to access AMS search page
-                        response = await client.get(
-                            AMS_SEARCH_URL,
-                            headers={
-                                "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1",
-                                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                            },
-                        )
+                        # Check for login page indicator
+                        if _LOGIN_MARKER_RE.search(html_bytes):
+                            self.log("Session is invalid - redirected to login page (HTTP check)")
+                            validation_time = time.time() - validation_start
+                            self.log(f"❌ Session validation failed in {validation_time:.2f}s")
+                            return False
                         
-                        http_time = time.time() - http_start
-                        self.log(f"HTTP request completed in {http_time:.2f}s")
+                        # Check for AMS page indicator
+                        if _AMS_MARKER_RE.search(html_bytes):
+                            self.log("Session is valid - can access AMS page (HTTP check)")
+                            validation_time = time.time() - validation_start
+                            self.log(f"✅ Session validation complete in {validation_time:.2f}s")
+                            return True
                         
-                        # Check if we're redirected to login page
-                        if response.status_code == 200:
-                            # Parse HTML to check if we're on login page or AMS page
-                            soup = BeautifulSoup(response.text, "html.parser")
-                            
-                            # Check for login page indicator
-                            login_indicator = soup.find(id="lName")
-                            if login_indicator:
-                                self.log("Session is invalid - redirected to login page (HTTP check)")
-                                validation_time = time.time() - validation_start
-                                self.log(f"❌ Session validation failed in {validation_time:.2f}s")
-                                return False
-                            
-                            # Check for AMS page indicator
-                            ams_indicator = soup.find(id="pre")
-                            if ams_indicator:
-                                self.log("Session is valid - can access AMS page (HTTP check)")
-                                validation_time = time.time() - validation_start
-                                self.log(f"✅ Session validation complete in {validation_time:.2f}s")
-                                return True
-                            
-                            # Check URL
-                            final_url = str(response.url)
-                            if "security" in final_url.lower() or "login" in final_url.lower():
-                                self.log("Session is invalid - on login page (URL check)")
-                                validation_time = time.time() - validation_start
-                                self.log(f"❌ Session validation failed in {validation_time:.2f}s")
-                                return False
-                            else:
-                                self.log("Session appears valid - not on login page (HTTP check)")
-                                validation_time = time.time() - validation_start
-                                self.log(f"✅ Session validation complete in {validation_time:.2f}s")
-                                return True
+                        # Check URL
+                        if "security" in final_url.lower() or "login" in final_url.lower():
+                            self.log("Session is invalid - on login page (URL check)")
+                            validation_time = time.time() - validation_start
+                            self.log(f"❌ Session validation failed in {validation_time:.2f}s")
+                            return False
+                        else:
+                            self.log("Session appears valid - not on login page (HTTP check)")
+                            validation_time = time.time() - validation_start
+                            self.log(f"✅ Session validation complete in {validation_time:.2f}s")
+                            return True
         except Exception as exc:
             self.log(f"HTTP validation failed: {exc} - falling back to browser validation")
         
@@ -442,43 +1070,37 @@ class NetChbDutyRunner:
             self.log(f"Using browser method for session validation...")
             self.log(f"Navigating to AMS page: {AMS_SEARCH_URL}")
             nav_start = time.time()
-            await self.page.goto(AMS_SEARCH_URL, wait_until="domcontentloaded", timeout=30000)
+            await self.page.goto(AMS_SEARCH_URL, wait_until="commit", timeout=SUBMIT_TIMEOUT_MS)
             self.log(f"Page loaded in {time.time() - nav_start:.2f}s. Current URL: {self.page.url}")
             
-            # Wait a bit for any redirects
-            await self.page.wait_for_timeout(2000)
-            
-            # Check if we're on login page (session invalid) or AMS page (session valid)
-            try:
-                # Check for login page indicator
-                await self.page.wait_for_selector("#lName", timeout=5000, state="visible")
+            # Check if we're on login page (session invalid) or AMS page (session valid);
+            # once the DOM is parsed a locator count answers immediately - no polling
+            await self.page.wait_for_load_state("domcontentloaded", timeout=SUBMIT_TIMEOUT_MS)
+            if await self.page.locator("#lName").count():
                 self.log("Session is invalid - redirected to login page")
                 validation_time = time.time() - validation_start
                 self.log(f"❌ Session validation failed in {validation_time:.2f}s")
                 return False
-            except Exception:
-                # Not on login page, check if we're on AMS page
-                try:
-                    # Check for AMS page elements (prefix field indicates we're logged in)
-                    await self.page.wait_for_selector("#pre", timeout=5000, state="visible")
-                    self.log("Session is valid - can access AMS page")
-                    validation_time = time.time() - validation_start
-                    self.log(f"✅ Session validation complete in {validation_time:.2f}s")
-                    return True
-                except Exception:
-                    # Ambiguous - check URL
-                    current_url = self.page.url
-                    if "security" in current_url.lower() or "login" in current_url.lower():
-                        self.log("Session is invalid - on login page (URL check)")
-                        validation_time = time.time() - validation_start
-                        self.log(f"❌ Session validation failed in {validation_time:.2f}s")
-                        return False
-                    else:
-                        # Might be on AMS or another protected page
-                        self.log("Session appears valid - not on login page")
-                        validation_time = time.time() - validation_start
-                        self.log(f"✅ Session validation complete in {validation_time:.2f}s")
-                        return True
+            if await self.page.locator("#pre").count():
+                # Prefix field indicates we're logged in
+                self.log("Session is valid - can access AMS page")
+                validation_time = time.time() - validation_start
+                self.log(f"✅ Session validation complete in {validation_time:.2f}s")
+                return True
+
+            # Ambiguous - check URL
+            current_url = self.page.url
+            if "security" in current_url.lower() or "login" in current_url.lower():
+                self.log("Session is invalid - on login page (URL check)")
+                validation_time = time.time() - validation_start
+                self.log(f"❌ Session validation failed in {validation_time:.2f}s")
+                return False
+            else:
+                # Might be on AMS or another protected page
+                self.log("Session appears valid - not on login page")
+                validation_time = time.time() - validation_start
+                self.log(f"✅ Session validation complete in {validation_time:.2f}s")
+                return True
         except Exception as exc:
             self.log(f"Error validating session: {exc}")
             validation_time = time.time() - validation_start
@@ -503,32 +1125,16 @@ class NetChbDutyRunner:
         if not self.page:
             raise RuntimeError("Page not initialized")
 
-        self._logs = []
+        self._logs.clear()
         digits = _normalize_mawb(mawb)
         result = DutyRunResult(mawb=digits)
         self.log("=" * 60)
         self.log(f"PROCESSING MAWB: {digits}")
         self.log("=" * 60)
 
-        summary: Dict[str, str] = {
-            "MAWB Number": digits,
-            "AMS Total HAWBs": "N/A",
-            "AMS Duty": "N/A",
-            "AMS Total T-11 Entries": "N/A",
-            "AMS Entries Accepted": "N/A",
-            "Rejected Entries": "N/A",
-            "7501 Total T-11 Entries": "N/A",
-            "7501 Total Houses": "N/A",
-            "7501 Duty": "N/A",
-            "Report Duty": "N/A",
-            "Report Total House": "N/A",
-            "Total Informal Duty": "N/A",
-            "Complete Total Duty": "N/A",
-            "Entry Date": "N/A",
-            "Cargo Release Date": "N/A",
-            "7501 Batch PDF URL": "N/A",
-            "Checkbook HAWBs": str(checkbook_hawbs).strip() if checkbook_hawbs is not None else "N/A",
-        }
+        summary: Dict[str, str] = _SUMMARY_TEMPLATE.copy()
+        summary["MAWB Number"] = digits
+        summary["Checkbook HAWBs"] = str(checkbook_hawbs).strip() if checkbook_hawbs is not None else "N/A"
         
         # Log checkbook_hawbs if provided
         if checkbook_hawbs is not None:
@@ -536,20 +1142,52 @@ class NetChbDutyRunner:
         else:
             self.log("Checkbook HAWBs not provided (will show as N/A)")
 
-        if sections.get("ams"):
+        # Entries section runs if:
+        # 1. Explicitly enabled (entries=True)
+        # 2. Custom report enabled (needs oldest_entry date)
+        # 3. PDF download enabled (needs entry_rows for PDF download)
+        # AMS and Entries are independent HTTP flows, so Entries starts now and runs alongside
+        # AMS. It writes into its own dict, merged after AMS so a missing master discards it.
+        entries_summary: Dict[str, str] = {}
+
+        async def run_entries_section() -> Optional[Dict[str, Any]]:
             try:
-                self.log("--- Starting AMS Section ---")
-                await self._process_ams_section(digits, summary)
-                self.log("--- AMS Section Complete ---")
+                self.log("--- Starting Entries Section ---")
+                entries_result = await self._process_entries_section(digits, entries_summary)
+                self.log("--- Entries Section Complete ---")
+                return entries_result
             except Exception as exc:
-                self.log(f"⚠️ AMS section failed (skipping - will show N/A values): {exc}")
-                import traceback
-                self.log(f"AMS section traceback: {traceback.format_exc()}")
+                self.log(f"⚠️ Entries section failed (skipping - will show N/A values): {exc}")
+                self.log(f"Entries section traceback: {traceback.format_exc()}")
                 # Keep N/A values in summary (already set above)
+                return None  # Ensure entries_data is None on failure
+
+        entries_task: Optional[asyncio.Task] = None
+        if sections.get("entries") or sections.get("custom") or sections.get("download_7501_pdf"):
+            entries_task = asyncio.create_task(run_entries_section())
+
+        try:
+            if sections.get("ams"):
+                try:
+                    self.log("--- Starting AMS Section ---")
+                    await self._process_ams_section(digits, summary)
+                    self.log("--- AMS Section Complete ---")
+                except Exception as exc:
+                    self.log(f"⚠️ AMS section failed (skipping - will show N/A values): {exc}")
+                    self.log(f"AMS section traceback: {traceback.format_exc()}")
+                    # Keep N/A values in summary (already set above)
+        except BaseException:  # Cancelled mid-AMS - don't leave Entries running unattended
+            if entries_task is not None:
+                entries_task.cancel()
+            raise
         
         # Check if master not found - skip further processing if so
         # Only check if AMS section was enabled (Master Status is only set by AMS section)
         if sections.get("ams") and summary.get("Master Status") == "Not Found":
+            if entries_task is not None:
+                entries_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await entries_task
             self.log("Master not found - skipping entries, custom report, and PDF download sections")
             result.status = "failed"
             result.error_message = "Master not found"
@@ -558,23 +1196,9 @@ class NetChbDutyRunner:
             return result
 
         entries_data = None
-        # Entries section runs if:
-        # 1. Explicitly enabled (entries=True)
-        # 2. Custom report enabled (needs oldest_entry date)
-        # 3. PDF download enabled (needs entry_rows for PDF download)
-        if sections.get("entries") or sections.get("custom") or sections.get("download_7501_pdf"):
-            try:
-                self.log("--- Starting Entries Section ---")
-                entries_data = await self._process_entries_section(
-                    digits, summary
-                )
-                self.log("--- Entries Section Complete ---")
-            except Exception as exc:
-                self.log(f"⚠️ Entries section failed (skipping - will show N/A values): {exc}")
-                import traceback
-                self.log(f"Entries section traceback: {traceback.format_exc()}")
-                # Keep N/A values in summary (already set above)
-                entries_data = None  # Ensure entries_data is None on failure
+        if entries_task is not None:
+            entries_data = await entries_task
+            summary.update(entries_summary)
 
         if sections.get("custom"):
             try:
@@ -597,7 +1221,6 @@ class NetChbDutyRunner:
                         self.log("--- Custom Report Section Complete ---")
             except Exception as exc:
                 self.log(f"⚠️ Custom report failed (skipping - will show N/A values): {exc}")
-                import traceback
                 self.log(f"Custom report traceback: {traceback.format_exc()}")
                 # Keep N/A values in summary (already set above)
 
@@ -617,7 +1240,7 @@ class NetChbDutyRunner:
                         self.log("⚠️ PDF download skipped: No entry_rows available (Entries section may have failed)")
                     else:
                         # Get session cookies from browser context
-                        storage_state = await self.context.storage_state()
+                        storage_state = await self._get_storage_state()
                         session_cookies = self._load_cookies_from_storage_state(storage_state)
                         
                         if not session_cookies:
@@ -625,31 +1248,19 @@ class NetChbDutyRunner:
                         else:
                             # Initial verification BEFORE PDF download (only if AMS and Custom Report enabled)
                             should_download = True
+                            initial_duties: Optional[Tuple[float, float]] = None  # (AMS, Report) once parsed
                             if sections.get("ams") and sections.get("custom"):
                                 try:
-                                    def parse_value(val):
-                                        if val is None:
-                                            return 0
-                                        if isinstance(val, (int, float)):
-                                            return float(val)
-                                        val_str = str(val).replace("$", "").replace(",", "").strip()
-                                        try:
-                                            return float(val_str)
-                                        except (ValueError, AttributeError):
-                                            return 0
-                                    
-                                    ams_hawbs = parse_value(summary.get("AMS Total HAWBs"))
-                                    houses_7501 = parse_value(summary.get("7501 Total Houses"))
-                                    report_houses = parse_value(summary.get("Report Total House"))
-                                    checkbook_hawbs = parse_value(summary.get("Checkbook HAWBs"))
-                                    rejected = parse_value(summary.get("Rejected Entries"))
-                                    ams_duty = parse_value(summary.get("AMS Duty"))
-                                    report_duty = parse_value(summary.get("Report Duty"))
+                                    (
+                                        ams_hawbs, houses_7501, report_houses, checkbook_hawbs,
+                                        rejected, ams_duty, report_duty,
+                                    ) = (_parse_money(summary.get(key)) for key in _INITIAL_VERIFICATION_KEYS)
+                                    initial_duties = (ams_duty, report_duty)
                                     
                                     tolerance = 0.01
                                     
                                     # Initial verification checks (before PDF download)
-                                    houses_match = ams_hawbs == houses_7501 == report_houses == checkbook_hawbs
+                                    houses_match = len({ams_hawbs, houses_7501, report_houses, checkbook_hawbs}) == 1
                                     rejected_ok = rejected == 0
                                     duties_match = abs(ams_duty - report_duty) <= tolerance
                                     
@@ -682,10 +1293,18 @@ class NetChbDutyRunner:
                                 )
                                 
                                 if pdf_path and pdf_path.exists():
+                                    # Extraction (CPU) and upload (network) only read the file - run both at once
+                                    extract_result, upload_result = await self._extract_and_upload_7501_pdf(
+                                        pdf_path, digits, airport_code=airport_code, customer=customer
+                                    )
+                                    
                                     # Extract entries and duty from PDF
-                                    try:
-                                        from .pdf_extractor import extract_entries_and_duty_from_pdf
-                                        entry_count, total_duty = extract_entries_and_duty_from_pdf(pdf_path)
+                                    if isinstance(extract_result, Exception):
+                                        self.log(f"PDF EXTRACTION ERROR: Failed to extract values: {extract_result}")
+                                        self.log(f"PDF extraction traceback: {''.join(traceback.format_exception(type(extract_result), extract_result, extract_result.__traceback__))}")
+                                        # Keep N/A values if extraction fails
+                                    else:
+                                        entry_count, total_duty = extract_result
                                         
                                         # Always update summary with extracted values (even if 0)
                                         summary["7501 Total T-11 Entries"] = str(entry_count)
@@ -700,24 +1319,13 @@ class NetChbDutyRunner:
                                             self.log(f"PDF EXTRACTION: Extracted total duty ${total_duty:.2f} from PDF")
                                         else:
                                             self.log("PDF EXTRACTION: ⚠️ Warning - No duty extracted from PDF (total=0)")
-                                    except Exception as extract_exc:
-                                        self.log(f"PDF EXTRACTION ERROR: Failed to extract values: {extract_exc}")
-                                        import traceback
-                                        self.log(f"PDF extraction traceback: {traceback.format_exc()}")
-                                        # Keep N/A values if extraction fails
                                     
                                     # Upload PDF to storage
-                                    try:
-                                        from .storage import NetChbDutyStorageManager
-                                        storage = NetChbDutyStorageManager()
-                                        
-                                        # Use airport_code and customer if provided (for file naming)
-                                        pdf_storage_path, pdf_url = storage.upload_pdf(
-                                            pdf_path,
-                                            digits,
-                                            airport_code=airport_code,
-                                            customer=customer,
-                                        )
+                                    if isinstance(upload_result, Exception):
+                                        self.log(f"PDF UPLOAD ERROR: Failed to upload PDF: {upload_result}")
+                                        summary["7501 Batch PDF URL"] = ""
+                                    else:
+                                        pdf_storage_path, pdf_url = upload_result
                                         
                                         summary["7501 Batch PDF URL"] = pdf_url if pdf_url and pdf_url.strip() else ""
                                         self.log(f"PDF DOWNLOAD: ✓ PDF uploaded to storage: {pdf_storage_path}")
@@ -725,22 +1333,14 @@ class NetChbDutyRunner:
                                         # Final verification after PDF download (now we have all values)
                                         if sections.get("ams") and sections.get("custom"):
                                             try:
-                                                def parse_value(val):
-                                                    if val is None:
-                                                        return 0
-                                                    if isinstance(val, (int, float)):
-                                                        return float(val)
-                                                    val_str = str(val).replace("$", "").replace(",", "").strip()
-                                                    try:
-                                                        return float(val_str)
-                                                    except (ValueError, AttributeError):
-                                                        return 0
-                                                
-                                                ams_duty = parse_value(summary.get("AMS Duty"))
-                                                report_duty = parse_value(summary.get("Report Duty"))
-                                                duty_7501 = parse_value(summary.get("7501 Duty"))
-                                                ams_t11 = parse_value(summary.get("AMS Total T-11 Entries"))
-                                                t11_7501 = parse_value(summary.get("7501 Total T-11 Entries"))
+                                                if initial_duties is not None:
+                                                    ams_duty, report_duty = initial_duties
+                                                else:
+                                                    ams_duty = _parse_money(summary.get("AMS Duty"))
+                                                    report_duty = _parse_money(summary.get("Report Duty"))
+                                                duty_7501, ams_t11, t11_7501 = (
+                                                    _parse_money(summary.get(key)) for key in _FINAL_VERIFICATION_KEYS
+                                                )
                                                 
                                                 tolerance = 0.01
                                                 
@@ -765,16 +1365,12 @@ class NetChbDutyRunner:
                                             pdf_path.unlink()
                                         except Exception:
                                             pass
-                                    except Exception as upload_exc:
-                                        self.log(f"PDF UPLOAD ERROR: Failed to upload PDF: {upload_exc}")
-                                        summary["7501 Batch PDF URL"] = ""
                                 else:
                                     self.log("PDF DOWNLOAD: ⚠️ PDF download failed or returned no file")
                 
                 self.log("--- PDF Download Section Complete ---")
             except Exception as exc:
                 self.log(f"⚠️ PDF download section failed: {exc}")
-                import traceback
                 self.log(f"PDF download traceback: {traceback.format_exc()}")
                 # Keep N/A values in summary (already set above)
 
@@ -813,59 +1409,59 @@ class NetChbDutyRunner:
             storage_state: Dictionary from save_session_state() containing cookies
             
         Returns:
-            Dictionary of cookies for httpx client
+            Dictionary of cookies for httpx client (shared between calls - do not mutate)
         """
-        cookies = {}
-        for cookie in storage_state.get("cookies", []):
-            name = cookie.get("name")
-            value = cookie.get("value")
-            if name and value:
-                cookies[name] = value
+        # _get_storage_state hands out the same snapshot until the browser changes it
+        if self._cookie_cache is not None and self._cookie_cache[0] is storage_state:
+            return self._cookie_cache[1]
+        cookies = {
+            cookie["name"]: cookie["value"]
+            for cookie in storage_state.get("cookies", ())
+            if cookie.get("name") and cookie.get("value")
+        }
+        self._cookie_cache = (storage_state, cookies)
         return cookies
     
-    def _extract_ams_mawb_id(self, html: str, url: Optional[str] = None) -> Optional[str]:
+    def _extract_ams_mawb_id(
+        self, html_or_doc: Union[str, bytes, lxml_html.HtmlElement, None], url: Optional[str] = None
+    ) -> Optional[str]:
         """
         Extract amsMawbId using multiple methods (fallback chain).
         
         Args:
-            html: HTML content
+            html_or_doc: HTML content, or a document already parsed by the caller (not re-parsed)
             url: Current URL (optional, for extracting from query params)
             
         Returns:
             amsMawbId string or None if not found
         """
-        soup = BeautifulSoup(html, "html.parser")
+        doc = _parse_html(html_or_doc) if isinstance(html_or_doc, (str, bytes)) else html_or_doc
         
         # Method 1: Extract from master link in search results table (PRIMARY)
-        results_div = soup.find("div", id="resultsDiv")
-        if results_div:
-            table = results_div.find("table")
-            if table:
-                tbody = table.find("tbody")
-                if tbody:
-                    rows = tbody.find_all("tr", class_=["light", "dark"])
-                    if rows:
-                        first_row = rows[0]
-                        mawb_link = first_row.find("td")
-                        if mawb_link:
-                            mawb_link = mawb_link.find("a")
-                            if mawb_link:
-                                href = mawb_link.get("href", "")
-                                if href and "amsMawbId=" in href:
-                                    ams_mawb_id = href.split("amsMawbId=")[1].split("&")[0]
-                                    self.log(f"  ✓ Extracted amsMawbId from search results link: {ams_mawb_id}")
-                                    return ams_mawb_id
+        rows = _AMS_ROWS_XPATH(doc) if doc is not None else []
+        if rows:
+            mawb_link = _first(_AMS_MAWB_LINK_XPATH(rows[0]))
+            if mawb_link is not None:
+                href = mawb_link.get("href", "")
+                match = _AMS_MAWB_RE.search(href) if href else None
+                if match:
+                    ams_mawb_id = match.group(1)
+                    self.log(f"  ✓ Extracted amsMawbId from search results link: {ams_mawb_id}")
+                    return ams_mawb_id
         
         # Method 2: Extract from URL query parameter (if already on master page)
-        if url and "amsMawbId=" in url:
-            ams_mawb_id = url.split("amsMawbId=")[1].split("&")[0]
+        match = _AMS_MAWB_RE.search(url) if url else None
+        if match:
+            ams_mawb_id = match.group(1)
             self.log(f"  ✓ Extracted amsMawbId from URL: {ams_mawb_id}")
             return ams_mawb_id
         
         self.log("  ⚠ Could not extract amsMawbId using any method")
         return None
     
-    def _parse_ams_search_results(self, html: str) -> Optional[Dict]:
+    def _parse_ams_search_results(
+        self, html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Parse AMS search results HTML and extract data from first result row.
         
@@ -875,74 +1471,72 @@ class NetChbDutyRunner:
         Returns:
             Dictionary with extracted data or None if parsing fails
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Find results table
-        results_div = soup.find("div", id="resultsDiv")
-        if not results_div:
-            self.log("ERROR: resultsDiv not found in HTML")
-            return None
+        doc = _parse_html(html, encoding)
         
-        table = results_div.find("table")
-        if not table:
-            self.log("ERROR: Results table not found")
-            return None
-        
-        tbody = table.find("tbody")
-        if not tbody:
-            self.log("ERROR: tbody not found")
-            return None
+        # Find result rows (skip header row) with a single query
+        rows = _AMS_ROWS_XPATH(doc) if doc is not None else []
+        if not rows:
+            # Walk the path step by step only to report which part of the results table is missing
+            results_div = doc.find(".//div[@id='resultsDiv']") if doc is not None else None
+            if results_div is None:
+                self.log("ERROR: resultsDiv not found in HTML")
+                return None
+            
+            table = results_div.find(".//table")
+            if table is None:
+                self.log("ERROR: Results table not found")
+                return None
+            
+            if table.find(".//tbody") is None:
+                self.log("ERROR: tbody not found")
+                return None
         
         # Check for "There is no awb" message in the HTML
-        page_text = soup.get_text().lower()
-        if "there is no awb" in page_text or "no awb" in page_text:
+        if (_NO_AWB_RE if isinstance(html, str) else _NO_AWB_BYTES_RE).search(html):
             self.log("Master not found: 'There is no awb' message detected")
             return {"master_not_found": True}
         
-        # Find first data row (skip header row)
-        rows = tbody.find_all("tr", class_=["light", "dark"])
         if not rows:
             self.log("WARNING: No result rows found")
             return {"master_not_found": True}
         
         first_row = rows[0]
-        cells = first_row.find_all("td")
+        cells = _CELLS_XPATH(first_row)
         
         if len(cells) < 7:
             self.log(f"ERROR: Expected at least 7 cells, found {len(cells)}")
             return None
         
         # Extract amsMawbId using multiple methods
-        ams_mawb_id = self._extract_ams_mawb_id(html)
+        ams_mawb_id = self._extract_ams_mawb_id(doc)
         
         # Extract master link from cell 0 (td:nth-child(1))
         mawb_cell = cells[0]
-        mawb_link = mawb_cell.find("a")
+        mawb_link = _first(_FIRST_LINK_XPATH(mawb_cell))
         master_link = None
         
-        if mawb_link:
+        if mawb_link is not None:
             href = mawb_link.get("href", "")
             if href:
                 # Convert to absolute URL
-                if href.startswith("/"):
-                    master_link = urljoin("https://www.netchb.com", href)
-                else:
-                    master_link = href
+                master_link = _absolute_url(href)
                 # If we didn't get amsMawbId from extract function, try from href
-                if not ams_mawb_id and "amsMawbId=" in href:
-                    ams_mawb_id = href.split("amsMawbId=")[1].split("&")[0]
+                if not ams_mawb_id:
+                    match = _AMS_MAWB_RE.search(href)
+                    if match:
+                        ams_mawb_id = match.group(1)
         
         # Cell 5 (td:nth-child(6)): Arrival Date - matching Playwright: td:nth-child(6)
         arrival_date = "N/A"
         if len(cells) > 5:
             arrival_cell = cells[5]
-            arrival_date = arrival_cell.get_text(strip=True) or "N/A"
+            arrival_date = _text(arrival_cell) or "N/A"
         
         # Cell 6 (td:nth-child(7)): Total HAWBs - matching Playwright: td:nth-child(7)
         total_hawbs = "N/A"
         if len(cells) > 6:
             hawbs_cell = cells[6]
-            total_hawbs = hawbs_cell.get_text(strip=True) or "N/A"
+            total_hawbs = _text(hawbs_cell) or "N/A"
         
         return {
             "ams_mawb_id": ams_mawb_id,
@@ -951,7 +1545,9 @@ class NetChbDutyRunner:
             "arrival_date": arrival_date,
         }
     
-    def _parse_entries_search_results(self, html: str) -> Optional[Dict]:
+    def _parse_entries_search_results(
+        self, html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Parse Entries search results HTML and extract entry data.
         
@@ -960,26 +1556,26 @@ class NetChbDutyRunner:
             
         Returns:
             Dictionary with:
-            - entry_rows: List of entry data (date, link, query_string)
+            - entry_rows: List of EntryRow (date, date_text, link, query_string)
             - total_entries: Total number of entries found
             - oldest_entry_date: Oldest entry date (datetime object)
         """
-        soup = BeautifulSoup(html, "html.parser")
+        doc = _parse_html(html, encoding)
         
         # Find the full table (not just tbody) to access header row
-        full_table = soup.select_one("#veForm > div.dataCell > table")
-        if not full_table:
-            full_table = soup.select_one("div.dataCell > table")
-            if full_table:
+        full_table = _first(_ENTRIES_TABLE_XPATH(doc)) if doc is not None else None
+        if full_table is None and doc is not None:
+            full_table = _first(_ENTRIES_TABLE_FALLBACK_XPATH(doc))
+            if full_table is not None:
                 self.log("  Using fallback selector: div.dataCell > table")
         
-        if not full_table:
+        if full_table is None:
             self.log("ERROR: Results table not found (tried both #veForm > div.dataCell > table and div.dataCell > table)")
             return None
         
         # Find tbody for data rows
-        results_table = full_table.find("tbody")
-        if not results_table:
+        results_table = _first(_FIRST_TBODY_XPATH(full_table))
+        if results_table is None:
             self.log("ERROR: Table tbody not found")
             return None
         
@@ -990,42 +1586,29 @@ class NetChbDutyRunner:
         
         def search_header_row_for_entry_date(header_row, row_label: str = ""):
             """Helper function to search a header row for Entry Date column."""
-            header_cells = header_row.find_all("td")
-            for col_idx, header_cell in enumerate(header_cells):
-                # Get text from header cell (including nested divs)
-                header_text = header_cell.get_text(strip=True)
-                # Also check nested div elements (some headers use divs like <div id="eDte_ob">Entry Date</div>)
-                divs = header_cell.find_all("div")
-                for div in divs:
-                    div_text = div.get_text(strip=True)
-                    if div_text:
-                        header_text = div_text
-                        break
-                
-                # Check for "Entry Date" (case-insensitive, flexible matching)
-                header_text_lower = header_text.lower()
-                if "entry date" in header_text_lower or "entrydate" in header_text_lower.replace(" ", ""):
-                    self.log(f"  ✓ Found 'Entry Date' header in column {col_idx + 1} (0-indexed: {col_idx}, text: '{header_text}'{row_label})")
-                    return col_idx
-            return None
+            found = _find_entry_date_column(header_row)
+            if found is None:
+                return None
+            col_idx, header_text = found
+            self.log(f"  ✓ Found 'Entry Date' header in column {col_idx + 1} (0-indexed: {col_idx}, text: '{header_text}'{row_label})")
+            return col_idx
         
         # Method 1: Try using the specific header row selector (tr:nth-child(2) - second row in tbody)
         # User specified: #veForm > div.dataCell > table > tbody > tr:nth-child(2) for most brokers including Allied
-        if results_table:
-            tbody_rows = results_table.find_all("tr")
-            # Check tr:nth-child(2) (index 1, 0-indexed) - second row
-            if len(tbody_rows) > 1:
-                header_row_candidate = tbody_rows[1]  # Second row (tr:nth-child(2))
-                entry_date_column_idx = search_header_row_for_entry_date(header_row_candidate, ", from tr:nth-child(2)")
-            
-            # Also check tr:nth-child(1) (first row) as fallback in case structure differs
-            if entry_date_column_idx is None and len(tbody_rows) > 0:
-                first_row = tbody_rows[0]  # First row (tr:nth-child(1))
-                entry_date_column_idx = search_header_row_for_entry_date(first_row, ", from tr:nth-child(1)")
+        tbody_rows = _ROWS_XPATH(results_table)
+        # Check tr:nth-child(2) (index 1, 0-indexed) - second row
+        if len(tbody_rows) > 1:
+            header_row_candidate = tbody_rows[1]  # Second row (tr:nth-child(2))
+            entry_date_column_idx = search_header_row_for_entry_date(header_row_candidate, ", from tr:nth-child(2)")
+        
+        # Also check tr:nth-child(1) (first row) as fallback in case structure differs
+        if entry_date_column_idx is None and len(tbody_rows) > 0:
+            first_row = tbody_rows[0]  # First row (tr:nth-child(1))
+            entry_date_column_idx = search_header_row_for_entry_date(first_row, ", from tr:nth-child(1)")
         
         # Method 2: Fallback to finding header rows by class="header"
         if entry_date_column_idx is None:
-            header_rows = full_table.find_all("tr", class_="header")
+            header_rows = _HEADER_ROWS_XPATH(full_table)
             if header_rows:
                 # Search through header rows for "Entry Date"
                 # Header rows may have rowspan attributes, but column index is still correct
@@ -1039,7 +1622,8 @@ class NetChbDutyRunner:
             self.log("  ⚠️ Warning: Could not find 'Entry Date' header, will try common column positions [6, 7, 5]")
             # We'll try multiple columns as fallback
         
-        rows = results_table.find_all("tr", class_=["light", "dark"])
+        # Data rows (tr.light / tr.dark) come from the same traversal used for header discovery
+        rows = [row for row in tbody_rows if not _DATA_ROW_CLASSES.isdisjoint(row.get("class", "").split())]
         if not rows:
             self.log("Entries not found: No entry rows found in results table")
             return {
@@ -1050,9 +1634,9 @@ class NetChbDutyRunner:
             }
         
         # Check if first row is a "No Results" message
-        first_row_text = rows[0].get_text(strip=True).lower()
+        first_row_text = _text(rows[0]).lower()
         if "no results" in first_row_text or "no entries" in first_row_text:
-            self.log(f"Entries not found: No entries found for this MAWB (message: '{rows[0].get_text(strip=True)}')")
+            self.log(f"Entries not found: No entries found for this MAWB (message: '{_text(rows[0])}')")
             return {
                 "entry_rows": [],
                 "total_entries": 0,
@@ -1061,48 +1645,46 @@ class NetChbDutyRunner:
             }
         
         entry_rows = []
-        entry_dates = []
+        # Running minimum instead of collecting every date for a final min()
+        oldest_entry_date: Optional[datetime] = None
+        dated_rows = 0
+        short_rows = 0
         
         for idx, row in enumerate(rows):
-            cells = row.find_all("td")
+            cells = _CELLS_XPATH(row)
             if len(cells) < 7:
-                self.log(f"WARNING: Row {idx+1} has {len(cells)} cells (expected at least 7)")
+                short_rows += 1
+                if self._verbose:
+                    self.log(f"WARNING: Row {idx+1} has {len(cells)} cells (expected at least 7)")
                 # Try to extract what we can even with fewer cells (matching test script)
                 if len(cells) >= 1:
                     # Still try to find entry link in first cell
                     link_cell = cells[0]
-                    link_elem = link_cell.find("a")
-                    if link_elem:
+                    link_elem = _first(_FIRST_LINK_XPATH(link_cell))
+                    if link_elem is not None:
                         href = link_elem.get("href", "")
                         if href:
-                            if href.startswith("/"):
-                                entry_link = urljoin("https://www.netchb.com", href)
-                            else:
-                                entry_link = href
-                            match = re.search(r"filerCode=[^&]+&entryNo=\d+", entry_link)
+                            entry_link = _absolute_url(href)
+                            match = _ENTRY_QS_RE.search(entry_link)
                             query_string = match.group(0) if match else None
-                            entry_rows.append({
-                                "date": None,
-                                "date_text": None,
-                                "link": entry_link,
-                                "query_string": query_string,
-                            })
-                            self.log(f"  ✓ Extracted entry link from row with {len(cells)} cells: {entry_link}")
+                            entry_rows.append(EntryRow(None, None, entry_link, query_string))
+                            if self._verbose:
+                                self.log(f"  ✓ Extracted entry link from row with {len(cells)} cells: {entry_link}")
                 continue
             
             # Extract Entry Date from the column identified in header (or fallback to common positions)
             date_cell = None
             date_text = None
+            entry_date = None
             
             # Try using the column index found from header first
             if entry_date_column_idx is not None:
                 if len(cells) > entry_date_column_idx:
-                    cell_text = cells[entry_date_column_idx].get_text(strip=True)
+                    cell_text = _text(cells[entry_date_column_idx])
                     # Check if it looks like a date (MM/DD/YY format)
-                    if cell_text and "/" in cell_text and len(cell_text) <= 10:
+                    if _DATE_RE.fullmatch(cell_text):
                         try:
-                            # Try to parse as date
-                            datetime.strptime(cell_text, "%m/%d/%y")
+                            entry_date = _parse_mmddyy(cell_text)
                             date_cell = cells[entry_date_column_idx]
                             date_text = cell_text
                             if idx == 0:  # Log only for first row to avoid spam
@@ -1115,12 +1697,11 @@ class NetChbDutyRunner:
                 # Try common positions: 5 (column 6), 6 (column 7), 4 (column 5)
                 for col_idx in [5, 6, 4]:
                     if len(cells) > col_idx:
-                        cell_text = cells[col_idx].get_text(strip=True)
+                        cell_text = _text(cells[col_idx])
                         # Check if it looks like a date (MM/DD/YY format)
-                        if cell_text and "/" in cell_text and len(cell_text) <= 10:
+                        if _DATE_RE.fullmatch(cell_text):
                             try:
-                                # Try to parse as date
-                                datetime.strptime(cell_text, "%m/%d/%y")
+                                entry_date = _parse_mmddyy(cell_text)
                                 date_cell = cells[col_idx]
                                 date_text = cell_text
                                 if idx == 0 and entry_date_column_idx is None:  # Log only for first row
@@ -1128,46 +1709,37 @@ class NetChbDutyRunner:
                                 break
                             except ValueError:
                                 continue
-            
-            entry_date = None
-            if date_text:
-                try:
-                    entry_date = datetime.strptime(date_text, "%m/%d/%y")
-                    entry_dates.append(entry_date)
-                except ValueError as exc:
-                    self.log(f"WARNING: Failed to parse date '{date_text}': {exc}")
+
+            if entry_date is not None:
+                dated_rows += 1
+                if oldest_entry_date is None or entry_date < oldest_entry_date:
+                    oldest_entry_date = entry_date
             
             # Cell 1 (td:nth-child(1)): Entry link
             link_cell = cells[0] if len(cells) > 0 else None
             entry_link = None
             query_string = None
             
-            if link_cell:
-                link_elem = link_cell.find("a")
-                if link_elem:
+            if link_cell is not None:
+                link_elem = _first(_FIRST_LINK_XPATH(link_cell))
+                if link_elem is not None:
                     href = link_elem.get("href", "")
                     if href:
                         # Convert to absolute URL
-                        if href.startswith("/"):
-                            entry_link = urljoin("https://www.netchb.com", href)
-                        else:
-                            entry_link = href
+                        entry_link = _absolute_url(href)
                         
                         # Extract query string (filerCode=...&entryNo=...)
-                        match = re.search(r"filerCode=[^&]+&entryNo=\d+", entry_link)
+                        match = _ENTRY_QS_RE.search(entry_link)
                         if match:
                             query_string = match.group(0)
             
-            entry_rows.append({
-                "date": entry_date,
-                "date_text": date_text if date_cell else None,
-                "link": entry_link,
-                "query_string": query_string,
-            })
-        
-        oldest_entry_date = min(entry_dates) if entry_dates else None
+            entry_rows.append(
+                EntryRow(entry_date, date_text if date_cell is not None else None, entry_link, query_string)
+            )
         
-        self.log(f"  Parsed {len(entry_rows)} entry rows, {len(entry_dates)} with dates")
+        if short_rows:
+            self.log(f"WARNING: {short_rows} row(s) had fewer than 7 cells (links extracted where present)")
+        self.log(f"  Parsed {len(entry_rows)} entry rows, {dated_rows} with dates")
         
         return {
             "entry_rows": entry_rows,
@@ -1175,7 +1747,7 @@ class NetChbDutyRunner:
             "oldest_entry_date": oldest_entry_date,
         }
     
-    def _parse_entry_detail_page(self, html: str) -> int:
+    def _parse_entry_detail_page(self, html: Union[str, bytes], encoding: Optional[str] = None) -> int:
         """
         Parse entry detail page HTML and count houses.
         
@@ -1185,16 +1757,13 @@ class NetChbDutyRunner:
         Returns:
             Number of houses (rows in #invBdy > tr)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
-        inv_body = soup.find("tbody", id="invBdy")
-        if not inv_body:
+        doc = _parse_html(html, encoding)
+        if doc is None:
             return 0
         
-        rows = inv_body.find_all("tr")
-        return len(rows)
+        return int(_INV_ROW_COUNT_XPATH(doc))
     
-    def _parse_print7501_page(self, html: str) -> float:
+    def _parse_print7501_page(self, html: Union[str, bytes], encoding: Optional[str] = None) -> float:
         """
         Parse print7501 page HTML and extract duty sum.
         
@@ -1204,23 +1773,16 @@ class NetChbDutyRunner:
         Returns:
             Sum of duty + fees
         """
-        soup = BeautifulSoup(html, "html.parser")
+        doc = _parse_html(html, encoding)
+        if doc is None:
+            return 0.0
         
         # Find duty table
-        duty_table = soup.select_one(
-            "#pForm > div:nth-child(1) > div:nth-child(2) > div > div.content > table"
-        )
-        if not duty_table:
-            duty_table = soup.select_one("div.formContainerWithLabel > div.content > table")
-        
-        if not duty_table:
+        duty_table = _first(_DUTY_TABLE_XPATH(doc))
+        if duty_table is None:
             return 0.0
         
-        tbody = duty_table.find("tbody")
-        if tbody:
-            rows = tbody.find_all("tr")
-        else:
-            rows = duty_table.find_all("tr")
+        rows = _DUTY_ROWS_XPATH(duty_table)
         
         if len(rows) < 2:
             return 0.0
@@ -1231,32 +1793,23 @@ class NetChbDutyRunner:
         
         if len(rows) > 1:
             duty_row = rows[1]
-            duty_cells = duty_row.find_all("td")
+            duty_cells = _CELLS_XPATH(duty_row)
             if len(duty_cells) >= 2:
-                if "duty" in duty_cells[0].get_text(strip=True).lower():
-                    duty_text = duty_cells[1].get_text(strip=True) or "0"
+                if "duty" in _text(duty_cells[0]).lower():
+                    duty_text = _text(duty_cells[1]) or "0"
         
         if len(rows) > 3:
             fees_row = rows[3]
-            fees_cells = fees_row.find_all("td")
+            fees_cells = _CELLS_XPATH(fees_row)
             if len(fees_cells) >= 2:
-                if "fee" in fees_cells[0].get_text(strip=True).lower():
-                    fees_text = fees_cells[1].get_text(strip=True) or "0"
+                if "fee" in _text(fees_cells[0]).lower():
+                    fees_text = _text(fees_cells[1]) or "0"
         
-        def parse_currency(value: str) -> float:
-            try:
-                cleaned = value.replace(",", "").replace("$", "").strip()
-                if not cleaned:
-                    return 0.0
-                return float(cleaned)
-            except Exception:
-                return 0.0
-        
-        duty = parse_currency(duty_text)
-        fees = parse_currency(fees_text)
-        return duty + fees
+        return float(_parse_money(duty_text) + _parse_money(fees_text))
     
-    def _parse_ams_master_page(self, html: str) -> Dict[str, str]:
+    def _parse_ams_master_page(
+        self, html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> Dict[str, str]:
         """
         Parse AMS master page HTML and extract duty/entries data.
         
@@ -1266,7 +1819,10 @@ class NetChbDutyRunner:
         Returns:
             Dictionary with extracted data
         """
-        soup = BeautifulSoup(html, "html.parser")
+        texts = {
+            elem_id: _text(elem)
+            for elem_id, elem in _find_elements_by_id(html, _AMS_SUMMARY_IDS, encoding).items()
+        }
         
         result = {
             "duty": "N/A",
@@ -1276,44 +1832,34 @@ class NetChbDutyRunner:
         }
         
         # Find #esH (7501 Total Houses) - positioned before #esD
-        houses_elem = soup.find(id="esH")
-        if houses_elem:
-            houses_text = houses_elem.get_text(strip=True)
-            # Remove commas from number (e.g., "3,690" -> "3690")
-            houses_text_clean = houses_text.replace(",", "").strip()
-            try:
-                houses_value = int(houses_text_clean) if houses_text_clean else 0
+        houses_text = texts.get("esH")
+        if houses_text is not None:
+            # Thousands separators are dropped (e.g., "3,690" -> 3690)
+            houses_value = _parse_count(houses_text)
+            if houses_value is not None:
                 result["houses_7501"] = str(houses_value)
                 self.log(f"AMS HTTP STEP 4: 7501 Houses={houses_value} (from #esH: '{houses_text}')")
-            except ValueError as e:
-                self.log(f"AMS HTTP STEP 4 ERROR: Failed to parse houses_text '{houses_text}' as int: {e}")
+            else:
+                self.log(f"AMS HTTP STEP 4 ERROR: Failed to parse houses_text '{houses_text}' as int")
                 result["houses_7501"] = "0"
         else:
             self.log("AMS HTTP STEP 4: ⚠️ #esH element not found in HTML")
             result["houses_7501"] = "0"
         
         # Find #esD (AMS Duty) - matching Playwright logic
-        duty_elem = soup.find(id="esD")
-        if duty_elem:
-            result["duty"] = duty_elem.get_text(strip=True) or "N/A"
+        duty_text = texts.get("esD")
+        if duty_text is not None:
+            result["duty"] = duty_text or "N/A"
         
         # Find #esC (Total T-11 Entries) - matching Playwright logic
-        t11_elem = soup.find(id="esC")
-        if t11_elem:
-            t11_text = t11_elem.get_text(strip=True)
-            try:
-                result["t11_entries"] = str(int(t11_text)) if t11_text else "0"
-            except ValueError:
-                result["t11_entries"] = "0"
+        t11_text = texts.get("esC")
+        if t11_text is not None:
+            result["t11_entries"] = str(_parse_count(t11_text) or 0)
         
         # Find #esA (Entries Accepted) - matching Playwright logic
-        accepted_elem = soup.find(id="esA")
-        if accepted_elem:
-            accepted_text = accepted_elem.get_text(strip=True)
-            try:
-                result["entries_accepted"] = str(int(accepted_text)) if accepted_text else "0"
-            except ValueError:
-                result["entries_accepted"] = "0"
+        accepted_text = texts.get("esA")
+        if accepted_text is not None:
+            result["entries_accepted"] = str(_parse_count(accepted_text) or 0)
         
         return result
     
@@ -1330,136 +1876,79 @@ class NetChbDutyRunner:
         
         prefix, number = mawb_digits[:3], mawb_digits[3:]
         
-        # Get cookies from current browser context
-        storage_state = await self.context.storage_state()
-        session_cookies = self._load_cookies_from_storage_state(storage_state)
+        headers = _AMS_HTTP_HEADERS
         
-        if not session_cookies:
-            raise RuntimeError("No cookies found in session - HTTP method requires valid session cookies")
+        # Build form payload
+        form_data = {**_AMS_SEARCH_FORM, "prefix": prefix, "mawb": number}
         
-        self.log(f"AMS HTTP: Using {len(session_cookies)} cookies from session")
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://www.netchb.com",
-            "Referer": "https://www.netchb.com/app/ams/viewMawbs.do",
-            "Cache-Control": "max-age=0",
-            "Connection": "keep-alive",
-            "DNT": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        # Shared keep-alive client carrying the browser session cookies
+        client = await self._session_http_client("AMS HTTP")
         
-        # Build form payload
-        form_data = {
-            "prefix": prefix,
-            "mawb": number,
-            "refNo": "",
-            "hawb": "",
-            "arrivalBegin": "",
-            "arrivalEnd": "",
-            "container": "",
-            "cbpStatus": "",
-            "acasStatus": "",
-            "arrivalAirport": "",
-            "carrier": "",
-            "flight": "",
-            "client": "0",
-            "clientName": "",
-            "searchByProfile": "true",
-            "searchTimePeriod": "Y1",
-            "location": "0",  # All Locations
-            "user": "",  # All Users
-            "noPerPage": "25",
-            "cfs": "false",
-            "pageNo": "0",
-            "orderBy": "amb1",
-        }
+        # STEP 1: POST to search endpoint
+        self.log("AMS HTTP STEP 1: POST to AMS search endpoint...")
+        try:
+            response = await client.post(
+                AMS_SEARCH_POST_URL,
+                data=form_data,
+                headers=headers,
+                timeout=60.0,
+            )
+            response.raise_for_status()
+            self.log(f"AMS HTTP STEP 1: Response status {response.status_code}, length {len(response.content)} bytes")
+        except Exception as exc:
+            self.log(f"AMS HTTP STEP 1 ERROR: Request failed: {exc}")
+            raise RuntimeError(f"AMS HTTP STEP 1 failed: {exc}") from exc
         
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            # Set cookies
-            for name, value in session_cookies.items():
-                client.cookies.set(name, value, domain=".netchb.com")
-            
-            # STEP 1: POST to search endpoint
-            self.log("AMS HTTP STEP 1: POST to AMS search endpoint...")
-            try:
-                response = await client.post(
-                    AMS_SEARCH_POST_URL,
-                    data=form_data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                self.log(f"AMS HTTP STEP 1: Response status {response.status_code}, length {len(response.text)} bytes")
-            except Exception as exc:
-                self.log(f"AMS HTTP STEP 1 ERROR: Request failed: {exc}")
-                raise RuntimeError(f"AMS HTTP STEP 1 failed: {exc}") from exc
-            
-            # STEP 2: Parse search results
-            self.log("AMS HTTP STEP 2: Parsing search results HTML...")
-            search_data = self._parse_ams_search_results(response.text)
-            
-            # Check if master not found
-            if search_data and search_data.get("master_not_found"):
-                self.log("Master not found for MAWB")
-                summary["Master Status"] = "Not Found"
-                return
-            
-            if not search_data:
-                raise RuntimeError("AMS HTTP STEP 2 ERROR: Failed to parse search results")
-            
-            summary["AMS Total HAWBs"] = search_data.get("total_hawbs", "N/A")
-            summary["AMS Arrival Date"] = search_data.get("arrival_date", "N/A")
-            self.log(f"AMS HTTP STEP 2: Total HAWBs={summary['AMS Total HAWBs']}, Arrival={summary['AMS Arrival Date']}")
-            
-            master_link = search_data.get("master_link")
-            if not master_link:
-                raise RuntimeError("AMS HTTP STEP 2 ERROR: No master link found in search results")
-            
-            # STEP 3: GET master page
-            self.log(f"AMS HTTP STEP 3: GET master page: {master_link}")
-            try:
-                master_response = await client.get(
-                    master_link,
-                    headers={
-                        "User-Agent": headers["User-Agent"],
-                        "Accept": headers["Accept"],
-                        "Referer": AMS_SEARCH_POST_URL,
-                    },
-                )
-                master_response.raise_for_status()
-                self.log(f"AMS HTTP STEP 3: Master page response status {master_response.status_code}, length {len(master_response.text)} bytes")
-            except Exception as exc:
-                self.log(f"AMS HTTP STEP 3 ERROR: Master page request failed: {exc}")
-                raise RuntimeError(f"AMS HTTP STEP 3 failed: {exc}") from exc
-            
-            # STEP 4: Parse master page
-            self.log("AMS HTTP STEP 4: Parsing master page HTML...")
-            master_data = self._parse_ams_master_page(master_response.text)
-            
-            summary["AMS Duty"] = master_data.get("duty", "N/A")
-            summary["AMS Total T-11 Entries"] = master_data.get("t11_entries", "0")
-            summary["AMS Entries Accepted"] = master_data.get("entries_accepted", "0")
-            summary["7501 Total Houses"] = master_data.get("houses_7501", "N/A")
-            
-            try:
-                t11 = int(master_data.get("t11_entries", "0"))
-                accepted = int(master_data.get("entries_accepted", "0"))
-                rejected = t11 - accepted
-            except (ValueError, TypeError):
-                rejected = 0
-            
-            summary["Rejected Entries"] = str(rejected)
-            
-            self.log(f"AMS HTTP STEP 4: Duty={summary['AMS Duty']}, T-11={summary['AMS Total T-11 Entries']}, Accepted={summary['AMS Entries Accepted']}, 7501 Houses={summary['7501 Total Houses']}")
-            self.log("AMS HTTP: AMS section complete (HTTP method)")
+        # STEP 2: Parse search results
+        self.log("AMS HTTP STEP 2: Parsing search results HTML...")
+        search_data = self._parse_ams_search_results(response.content, response.encoding)
+        
+        # Check if master not found
+        if search_data and search_data.get("master_not_found"):
+            self.log("Master not found for MAWB")
+            summary["Master Status"] = "Not Found"
+            return
+        
+        if not search_data:
+            raise RuntimeError("AMS HTTP STEP 2 ERROR: Failed to parse search results")
+        
+        summary["AMS Total HAWBs"] = search_data.get("total_hawbs", "N/A")
+        summary["AMS Arrival Date"] = search_data.get("arrival_date", "N/A")
+        self.log(f"AMS HTTP STEP 2: Total HAWBs={summary['AMS Total HAWBs']}, Arrival={summary['AMS Arrival Date']}")
+        
+        master_link = search_data.get("master_link")
+        if not master_link:
+            raise RuntimeError("AMS HTTP STEP 2 ERROR: No master link found in search results")
+        
+        # STEP 3: GET master page
+        self.log(f"AMS HTTP STEP 3: GET master page: {master_link}")
+        try:
+            master_response = await self._http_get(master_link, headers=_AMS_MASTER_GET_HEADERS)
+            self.log(f"AMS HTTP STEP 3: Master page response status {master_response.status_code}, length {len(master_response.content)} bytes")
+        except Exception as exc:
+            self.log(f"AMS HTTP STEP 3 ERROR: Master page request failed: {exc}")
+            raise RuntimeError(f"AMS HTTP STEP 3 failed: {exc}") from exc
+        
+        # STEP 4: Parse master page
+        self.log("AMS HTTP STEP 4: Parsing master page HTML...")
+        master_data = self._parse_ams_master_page(master_response.content, master_response.encoding)
+        
+        summary["AMS Duty"] = master_data.get("duty", "N/A")
+        summary["AMS Total T-11 Entries"] = master_data.get("t11_entries", "0")
+        summary["AMS Entries Accepted"] = master_data.get("entries_accepted", "0")
+        summary["7501 Total Houses"] = master_data.get("houses_7501", "N/A")
+        
+        try:
+            t11 = int(master_data.get("t11_entries", "0"))
+            accepted = int(master_data.get("entries_accepted", "0"))
+            rejected = t11 - accepted
+        except (ValueError, TypeError):
+            rejected = 0
+        
+        summary["Rejected Entries"] = str(rejected)
+        
+        self.log(f"AMS HTTP STEP 4: Duty={summary['AMS Duty']}, T-11={summary['AMS Total T-11 Entries']}, Accepted={summary['AMS Entries Accepted']}, 7501 Houses={summary['7501 Total Houses']}")
+        self.log("AMS HTTP: AMS section complete (HTTP method)")
 
     async def _process_ams_section(self, mawb_digits: str, summary: Dict[str, str]) -> None:
         """
@@ -1513,7 +2002,10 @@ class NetChbDutyRunner:
         self.log("AMS STEP 6: User selected")
 
         self.log("AMS STEP 7: Clicking search button...")
-        await ams_page.click("#mF > div > div.content > table > tbody > tr:nth-child(6) > td:nth-child(4) > input[type=submit]")
+        await ams_page.click(
+            "#mF > div > div.content > table > tbody > tr:nth-child(6) > td:nth-child(4) > input[type=submit]",
+            timeout=SUBMIT_TIMEOUT_MS,
+        )
         self.log("AMS STEP 7: Search button clicked")
 
         self.log("AMS STEP 8: Waiting for search results (timeout: 60s - site is slow)...")
@@ -1523,35 +2015,33 @@ class NetChbDutyRunner:
         )
         self.log("AMS STEP 8: Search results loaded")
 
-        rows = await ams_page.query_selector_all(
-            "#resultsDiv > table > tbody > tr.light, #resultsDiv > table > tbody > tr.dark"
+        # Row count and the first row's cells/link in one call (no element handle per row)
+        row_count, hawbs, arrival, has_master_link, master_link = await ams_page.eval_on_selector_all(
+            "#resultsDiv > table > tbody > tr.light, #resultsDiv > table > tbody > tr.dark",
+            _AMS_FIRST_ROW_JS,
         )
-        self.log(f"AMS STEP 9: Found {len(rows)} result rows")
+        self.log(f"AMS STEP 9: Found {row_count} result rows")
 
         # Check for "There is no awb" message on the page
+        # Case-insensitive scan of the raw page (no lowered copy); "there is no awb" contains "no awb"
         page_content = await ams_page.content()
-        page_text = page_content.lower()
-        if "there is no awb" in page_text or "no awb" in page_text:
+        if _NO_AWB_RE.search(page_content):
             self.log("Master not found: 'There is no awb' message detected")
             summary["Master Status"] = "Not Found"
             await ams_page.close()
             return
 
-        if not rows:
+        if not row_count:
             self.log("AMS STEP 9: No results found for this MAWB - Master not found")
             summary["Master Status"] = "Not Found"
             await ams_page.close()
             return
         else:
-            hawbs = await rows[0].query_selector("td:nth-child(7)")
-            arrival = await rows[0].query_selector("td:nth-child(6)")
-            summary["AMS Total HAWBs"] = (await hawbs.inner_text()).strip() if hawbs else "N/A"
-            summary["AMS Arrival Date"] = (await arrival.inner_text()).strip() if arrival else "N/A"
+            summary["AMS Total HAWBs"] = hawbs if hawbs is not None else "N/A"
+            summary["AMS Arrival Date"] = arrival if arrival is not None else "N/A"
             self.log(f"AMS STEP 9: Total HAWBs: {summary['AMS Total HAWBs']}, Arrival: {summary['AMS Arrival Date']}")
 
-            master_link_elem = await rows[0].query_selector("td:nth-child(1) > a")
-            if master_link_elem:
-                master_link = await master_link_elem.get_attribute("href")
+            if has_master_link:
                 if not master_link:
                     self.log("AMS STEP 10 ERROR: Master link href is empty")
                 else:
@@ -1570,15 +2060,13 @@ class NetChbDutyRunner:
                 try:
                     self.log("AMS STEP 11: Waiting for master page elements (timeout: 30s)...")
                     await ams_page.wait_for_selector("#esD", timeout=30000)  # 30 seconds
-                    houses_elem = await ams_page.query_selector("#esH")
-                    duty_elem = await ams_page.query_selector("#esD")
-                    t11_elem = await ams_page.query_selector("#esC")
-                    accepted_elem = await ams_page.query_selector("#esA")
+                    houses_text, duty, t11_text, accepted_text = await ams_page.eval_on_selector(
+                        "html", _INNER_TEXTS_JS, ["#esH", "#esD", "#esC", "#esA"]
+                    )
 
-                    if houses_elem:
-                        houses_text = (await houses_elem.inner_text()).strip()
+                    if houses_text is not None:
                         # Remove commas from number (e.g., "3,690" -> "3690")
-                        houses_text_clean = houses_text.replace(",", "").strip()
+                        houses_text_clean = houses_text.translate(_COMMA_STRIP)
                         try:
                             houses_7501 = int(houses_text_clean) if houses_text_clean else 0
                         except ValueError:
@@ -1587,9 +2075,10 @@ class NetChbDutyRunner:
                     else:
                         self.log("AMS STEP 11: ⚠️ #esH element not found")
                         houses_7501 = 0
-                    duty = (await duty_elem.inner_text()).strip() if duty_elem else "N/A"
-                    t11_entries = int((await t11_elem.inner_text()).strip()) if t11_elem else 0
-                    entries_accepted = int((await accepted_elem.inner_text()).strip()) if accepted_elem else 0
+                    if duty is None:
+                        duty = "N/A"
+                    t11_entries = int(t11_text.translate(_COMMA_STRIP)) if t11_text is not None else 0
+                    entries_accepted = int(accepted_text.translate(_COMMA_STRIP)) if accepted_text is not None else 0
 
                     summary["7501 Total Houses"] = str(houses_7501)
                     summary["AMS Duty"] = duty
@@ -1640,125 +2129,72 @@ class NetChbDutyRunner:
         if not self.context:
             raise RuntimeError("Context not initialized")
         
-        # Get cookies from current browser context
-        storage_state = await self.context.storage_state()
-        session_cookies = self._load_cookies_from_storage_state(storage_state)
-        
-        if not session_cookies:
-            raise RuntimeError("No cookies found in session - HTTP method requires valid session cookies")
-        
-        self.log(f"ENTRIES HTTP: Using {len(session_cookies)} cookies from session")
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://www.netchb.com",
-            "Referer": "https://www.netchb.com/app/entry/index.jsp",
-            "Cache-Control": "max-age=0",
-            "Connection": "keep-alive",
-            "DNT": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        headers = _HTTP_FORM_HEADERS
         
         # Build form payload (matching test script - includes all fields from network capture)
-        form_data = {
-            "entryNoSearch": "",
-            "brokerRefNo": "",
-            "importerRecord": "0",
-            "importerRecordName": "",
-            "importerSearchByProfile": "true",
-            "ultimateConsignee": "0",
-            "ultimateConsigneeName": "",
-            "ultimateConsigneeSearchByProfile": "true",
-            "freightForwarder": "0",
-            "freightForwarderName": "",
-            "freightForwarderSearchByProfile": "true",
-            "begin": "",
-            "end": "",
-            "entryStatus": "",
-            "cargoReleaseStatus": "",
-            "manifestStatus": "",
-            "pgaAgency": "",
-            "ogaStatus": "",
-            "statusColor": "",
-            "entryType": "",
-            "portEntry": "",
-            "modeTransport": "",
-            "masterBill": mawb_digits,  # Full 11-digit MAWB
-            "searchTimePeriod": "Y1",  # 1 Year
-            "user": "",  # All Users (empty string)
-            "location": "0",  # All Locations
-            "noPerPage": "1000",  # Show 1000 per page
-            "entryNo": "0",
-            "orderBy": "vep1",  # Order by Entry No
-        }
+        form_data = {**_ENTRIES_SEARCH_FORM, "masterBill": mawb_digits}
         
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            # Set cookies
-            for name, value in session_cookies.items():
-                client.cookies.set(name, value, domain=".netchb.com")
-            
-            # STEP 1: POST to search endpoint
-            self.log("ENTRIES HTTP STEP 1: POST to Entries search endpoint...")
-            self.log(f"ENTRIES HTTP STEP 1: Payload: masterBill={mawb_digits}, location=0, user=, noPerPage=1000, searchTimePeriod=Y1")
-            try:
-                response = await client.post(
-                    ENTRIES_SEARCH_POST_URL,
-                    data=form_data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                self.log(f"ENTRIES HTTP STEP 1: Response status {response.status_code}, length {len(response.text)} bytes")
-                # Debug: Save first 500 chars of response to check if it's the right page
-                response_preview = response.text[:500].replace('\n', ' ').replace('\r', ' ')
-                self.log(f"ENTRIES HTTP STEP 1: Response preview (first 500 chars): {response_preview}")
-            except Exception as exc:
-                self.log(f"ENTRIES HTTP STEP 1 ERROR: Request failed: {exc}")
-                raise RuntimeError(f"ENTRIES HTTP STEP 1 failed: {exc}") from exc
-            
-            # STEP 2: Parse search results
-            self.log("ENTRIES HTTP STEP 2: Parsing search results HTML...")
-            search_data = self._parse_entries_search_results(response.text)
-            
-            if not search_data:
-                raise RuntimeError("ENTRIES HTTP STEP 2 ERROR: Failed to parse search results")
-            
-            # Check if entries not found
-            if search_data.get("entries_not_found"):
-                self.log("Entries not found for this MAWB")
-                summary["Entries Status"] = "Not Found"
-                return {
-                    "oldest_entry": None,
-                    "entries_not_found": True,
-                }
-            
-            oldest_entry = search_data.get("oldest_entry_date")
-            if oldest_entry:
-                summary["Entry Date"] = oldest_entry.strftime("%m/%d/%y")
-                self.log(f"ENTRIES HTTP STEP 2: Oldest entry date: {summary['Entry Date']}")
-            
-            # ARCHIVED: STEP 3 - Entry details scraping removed
-            # "7501 Total T-11 Entries" now extracted from PDF (Phase 4)
-            # "7501 Total Houses" now extracted from AMS section (Phase 2)
-            # "7501 Duty" now extracted from PDF (Phase 4)
-            # Values remain "N/A" here if PDF download not enabled
-            
-            self.log("ENTRIES HTTP: Entries section complete (HTTP method)")
-            # Store entry_rows for potential reuse in PDF download
-            entry_rows = search_data.get("entry_rows", [])
-            self._last_entry_rows = entry_rows
+        # Shared keep-alive client carrying the browser session cookies
+        client = await self._session_http_client("ENTRIES HTTP")
+        
+        # STEP 1: POST to search endpoint
+        self.log("ENTRIES HTTP STEP 1: POST to Entries search endpoint...")
+        self.log(f"ENTRIES HTTP STEP 1: Payload: masterBill={mawb_digits}, location=0, user=, noPerPage=1000, searchTimePeriod=Y1")
+        try:
+            response = await client.post(
+                ENTRIES_SEARCH_POST_URL,
+                data=form_data,
+                headers=headers,
+                timeout=60.0,
+            )
+            response.raise_for_status()
+            self.log(f"ENTRIES HTTP STEP 1: Response status {response.status_code}, length {len(response.content)} bytes")
+            # Debug: Save first 500 chars of response to check if it's the right page
+            response_preview = (
+                response.content[:500].decode(response.encoding or "utf-8", errors="replace")
+                .replace('\n', ' ').replace('\r', ' ')
+            )
+            self.log(f"ENTRIES HTTP STEP 1: Response preview (first 500 bytes): {response_preview}")
+        except Exception as exc:
+            self.log(f"ENTRIES HTTP STEP 1 ERROR: Request failed: {exc}")
+            raise RuntimeError(f"ENTRIES HTTP STEP 1 failed: {exc}") from exc
+        
+        # STEP 2: Parse search results
+        self.log("ENTRIES HTTP STEP 2: Parsing search results HTML...")
+        search_data = self._parse_entries_search_results(response.content, response.encoding)
+        
+        if not search_data:
+            raise RuntimeError("ENTRIES HTTP STEP 2 ERROR: Failed to parse search results")
+        
+        # Check if entries not found
+        if search_data.get("entries_not_found"):
+            self.log("Entries not found for this MAWB")
+            summary["Entries Status"] = "Not Found"
             return {
-                "oldest_entry": oldest_entry,
-                "entry_rows": entry_rows,
-                "entries_not_found": search_data.get("entries_not_found", False),
+                "oldest_entry": None,
+                "entries_not_found": True,
             }
+        
+        oldest_entry = search_data.get("oldest_entry_date")
+        if oldest_entry:
+            summary["Entry Date"] = oldest_entry.strftime("%m/%d/%y")
+            self.log(f"ENTRIES HTTP STEP 2: Oldest entry date: {summary['Entry Date']}")
+        
+        # ARCHIVED: STEP 3 - Entry details scraping removed
+        # "7501 Total T-11 Entries" now extracted from PDF (Phase 4)
+        # "7501 Total Houses" now extracted from AMS section (Phase 2)
+        # "7501 Duty" now extracted from PDF (Phase 4)
+        # Values remain "N/A" here if PDF download not enabled
+        
+        self.log("ENTRIES HTTP: Entries section complete (HTTP method)")
+        # Store entry_rows for potential reuse in PDF download
+        entry_rows = search_data.get("entry_rows", [])
+        self._last_entry_rows = entry_rows
+        return {
+            "oldest_entry": oldest_entry,
+            "entry_rows": entry_rows,
+            "entries_not_found": search_data.get("entries_not_found", False),
+        }
     
     async def _process_entries_section_browser(
         self,
@@ -1802,71 +2238,61 @@ class NetChbDutyRunner:
         self.log("ENTRIES STEP 6: Number of pages selected")
 
         self.log("ENTRIES STEP 7: Clicking search button (#subB)...")
-        await entries_page.click("#subB")
+        await entries_page.click("#subB", timeout=SUBMIT_TIMEOUT_MS)
         self.log("ENTRIES STEP 7: Search button clicked")
 
         self.log("ENTRIES STEP 8: Waiting for results table (timeout: 60s - site is slow)...")
         await entries_page.wait_for_selector("#veForm > div.dataCell > table > tbody", timeout=60000)  # 60 seconds
         self.log("ENTRIES STEP 8: Results table loaded")
 
+        # Get the full table HTML once; headers and rows are both read from it with lxml
+        # instead of one browser round-trip per row and cell
+        table_html = await entries_page.locator("#veForm > div.dataCell > table").inner_html()
+        table_doc = _parse_html(f"<table>{table_html}</table>")
+
         # Find Entry Date column index from header row dynamically
         entry_date_column_idx = None
         try:
-            # Get the full table HTML to parse headers
-            table_html = await entries_page.locator("#veForm > div.dataCell > table").inner_html()
-            soup = BeautifulSoup(table_html, "html.parser")
-            
             # Find header rows
-            header_rows = soup.find_all("tr", class_="header")
-            if header_rows:
-                # Search through header rows for "Entry Date"
-                for header_row in header_rows:
-                    header_cells = header_row.find_all("td")
-                    for col_idx, header_cell in enumerate(header_cells):
-                        # Get text from header cell (including nested divs)
-                        header_text = header_cell.get_text(strip=True)
-                        # Also check nested div elements
-                        divs = header_cell.find_all("div")
-                        for div in divs:
-                            div_text = div.get_text(strip=True)
-                            if div_text:
-                                header_text = div_text
-                                break
-                        
-                        # Check for "Entry Date" (case-insensitive)
-                        header_text_lower = header_text.lower()
-                        if "entry date" in header_text_lower or "entrydate" in header_text_lower.replace(" ", ""):
-                            entry_date_column_idx = col_idx
-                            self.log(f"ENTRIES STEP 8.5: ✓ Found 'Entry Date' header in column {col_idx + 1} (0-indexed: {col_idx}, text: '{header_text}')")
-                            break
-                    if entry_date_column_idx is not None:
-                        break
+            header_rows = _HEADER_ROWS_XPATH(table_doc) if table_doc is not None else []
+            # Search through header rows for "Entry Date"
+            for header_row in header_rows:
+                found = _find_entry_date_column(header_row)
+                if found is not None:
+                    entry_date_column_idx, header_text = found
+                    self.log(f"ENTRIES STEP 8.5: ✓ Found 'Entry Date' header in column {entry_date_column_idx + 1} (0-indexed: {entry_date_column_idx}, text: '{header_text}')")
+                    break
             
             if entry_date_column_idx is None:
                 self.log("ENTRIES STEP 8.5: ⚠️ Warning: Could not find 'Entry Date' header, will use fallback column 6")
         except Exception as exc:
             self.log(f"ENTRIES STEP 8.5: ⚠️ Warning: Failed to find Entry Date header ({exc}), will use fallback column 6")
 
-        rows = await entries_page.query_selector_all("#veForm > div.dataCell > table > tbody tr.light, #veForm > div.dataCell > table > tbody tr.dark")
+        rows = _ENTRIES_DATA_ROWS_XPATH(table_doc) if table_doc is not None else []
         self.log(f"ENTRIES STEP 9: Found {len(rows)} entry rows")
 
-        entry_dates: List[datetime] = []
+        oldest_entry: Optional[datetime] = None
         entry_links: List[str] = []
         query_strings: List[str] = []
+        # Relative links resolve against the results page; site-relative ones are a plain concat
+        base_url = entries_page.url
+        base_parts = urlsplit(base_url)
+        base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
 
         for idx, row in enumerate(rows):
             try:
                 # Use dynamically found column index, or fallback to column 6
                 column_to_use = entry_date_column_idx if entry_date_column_idx is not None else 5  # 0-indexed: 5 = column 6
-                date_elem = await row.query_selector(f"td:nth-child({column_to_use + 1})")
-                if date_elem:
-                    date_text = (await date_elem.inner_text()).strip()
+                date_elem = _first(_NTH_CELL_XPATH(row, n=column_to_use + 1))
+                if date_elem is not None:
+                    date_text = _text(date_elem)
                     if date_text:
                         # Validate it looks like a date before parsing
                         if "/" in date_text and len(date_text) <= 10:
                             try:
-                                parsed_date = datetime.strptime(date_text, "%m/%d/%y")
-                                entry_dates.append(parsed_date)
+                                parsed_date = _parse_mmddyy(date_text)
+                                if oldest_entry is None or parsed_date < oldest_entry:
+                                    oldest_entry = parsed_date
                                 if idx == 0:  # Log only for first row to avoid spam
                                     self.log(f"ENTRIES STEP 9.{idx+1}: Entry date found in column {column_to_use + 1}: {date_text}")
                             except ValueError:
@@ -1876,12 +2302,13 @@ class NetChbDutyRunner:
                                     for fallback_col in [5, 6, 4]:  # Columns 6, 7, 5
                                         if fallback_col != column_to_use:
                                             try:
-                                                fallback_elem = await row.query_selector(f"td:nth-child({fallback_col + 1})")
-                                                if fallback_elem:
-                                                    fallback_text = (await fallback_elem.inner_text()).strip()
+                                                fallback_elem = _first(_NTH_CELL_XPATH(row, n=fallback_col + 1))
+                                                if fallback_elem is not None:
+                                                    fallback_text = _text(fallback_elem)
                                                     if fallback_text and "/" in fallback_text:
-                                                        parsed_date = datetime.strptime(fallback_text, "%m/%d/%y")
-                                                        entry_dates.append(parsed_date)
+                                                        parsed_date = _parse_mmddyy(fallback_text)
+                                                        if oldest_entry is None or parsed_date < oldest_entry:
+                                                            oldest_entry = parsed_date
                                                         self.log(f"ENTRIES STEP 9.{idx+1}: Entry date found in fallback column {fallback_col + 1}: {fallback_text}")
                                                         break
                                             except:
@@ -1892,23 +2319,25 @@ class NetChbDutyRunner:
 
             # Extract entry links (needed for PDF download in Phase 4)
             try:
-                link_elem = await row.query_selector("td:nth-child(1) a")
-                if link_elem:
-                    link = await link_elem.get_attribute("href")
+                first_cell = _first(_NTH_CELL_XPATH(row, n=1))
+                link_elem = _first(_FIRST_LINK_XPATH(first_cell)) if first_cell is not None else None
+                if link_elem is not None:
+                    link = link_elem.get("href")
                     if link:
                         # Convert relative URL to absolute URL
                         if not link.startswith("http"):
-                            base_url = entries_page.url
-                            link = urljoin(base_url, link)
+                            if link.startswith("/") and not link.startswith("//"):
+                                link = base_origin + link
+                            else:
+                                link = urljoin(base_url, link)
                             self.log(f"ENTRIES STEP 9.{idx+1}: Converted relative entry URL to absolute: {link}")
                         entry_links.append(link)
-                        match = re.search(r"filerCode=[^&]+&entryNo=\d+", link)
+                        match = _ENTRY_QS_RE.search(link)
                         if match:
                             query_strings.append(match.group(0))
             except Exception as exc:
                 self.log(f"ENTRIES STEP 9.{idx+1}: Failed to extract link: {exc}")
 
-        oldest_entry = min(entry_dates) if entry_dates else None
         if oldest_entry:
             summary["Entry Date"] = oldest_entry.strftime("%m/%d/%y")
             self.log(f"ENTRIES STEP 10: Oldest entry date: {summary['Entry Date']}")
@@ -1922,7 +2351,7 @@ class NetChbDutyRunner:
         
         # Convert entry_links to entry_rows format for PDF download reuse
         entry_rows = [
-            {"link": link, "query_string": qs}
+            EntryRow(None, None, link, qs)
             for link, qs in zip(entry_links, query_strings)
         ]
 
@@ -1939,7 +2368,7 @@ class NetChbDutyRunner:
         self,
         client: httpx.AsyncClient,
         session_cookies: Dict[str, str],
-        entry_rows: List[Dict],
+        entry_rows: List[EntryRow],
         headers: Dict[str, str],
     ) -> Tuple[int, float, int, int]:
         """
@@ -1947,9 +2376,9 @@ class NetChbDutyRunner:
         No longer used - "7501 Total Houses" and "7501 Duty" are now extracted from PDF.
         
         Args:
-            client: httpx client with cookies already set
-            session_cookies: Session cookies for setting on new requests
-            entry_rows: List of entry row dictionaries with 'link' and 'query_string'
+            client: httpx client with cookies already set (shared by every detail request)
+            session_cookies: Session cookies (kept for callers; the client already carries them)
+            entry_rows: EntryRow list (uses 'link' and 'query_string')
             headers: HTTP headers to use
             
         Returns:
@@ -1959,140 +2388,106 @@ class NetChbDutyRunner:
         entries_total_duty = 0.0
         entry_detail_failures = 0
         print7501_failures = 0
-        batch_size = 6  # Process 6 at a time (user requested)
-        
-        entry_links = [row["link"] for row in entry_rows if row.get("link")]
-        query_strings = [row["query_string"] for row in entry_rows if row.get("query_string")]
+        max_in_flight = 6  # At most 6 requests at a time (user requested)
+        # One slow page only holds its own slot, instead of stalling a whole batch of 6
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        entry_links = [row.link for row in entry_rows if row.link]
+        query_strings = [row.query_string for row in entry_rows if row.query_string]
+        # GET headers for every detail/print7501 request (and retry), built once per batch run
+        entry_detail_headers = {
+            "User-Agent": headers["User-Agent"],
+            "Accept": headers["Accept"],
+            "Referer": ENTRIES_SEARCH_POST_URL,
+        }
+        print7501_headers = {**entry_detail_headers, "Referer": ENTRY_DETAIL_URL}
         
-        self.log(f"ENTRIES_DETAILS HTTP STEP 1: Processing {len(entry_links)} entry links in batches of {batch_size}...")
+        self.log(f"ENTRIES_DETAILS HTTP STEP 1: Processing {len(entry_links)} entry links, {max_in_flight} at a time...")
         
-        # Process entry detail pages
-        async def fetch_entry_houses(link: str, idx: int, total: int) -> Tuple[int, bool]:
-            """Fetch and parse a single entry detail page with retry logic."""
-            max_retries = 3
-            retry_delay = 1.0
-            timeout_seconds = 120.0  # 2 minutes for entry detail pages
-            
+        # Retry policy shared by the entry detail and print7501 fetches
+        max_retries = 3
+        retry_delay = 1.0
+
+        async def get_with_retry(
+            url: str, request_headers: Dict[str, str], timeout_seconds: float, label: str
+        ) -> Optional[httpx.Response]:
+            """GET retried on network errors and 5xx; None (failure logged) once retries run out."""
             for attempt in range(max_retries):
+                last_attempt = attempt == max_retries - 1
                 try:
-                    async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True) as req_client:
-                        for name, value in session_cookies.items():
-                            req_client.cookies.set(name, value, domain=".netchb.com")
-                        
-                        response = await req_client.get(
-                            link,
-                            headers={
-                                "User-Agent": headers["User-Agent"],
-                                "Accept": headers["Accept"],
-                                "Referer": ENTRIES_SEARCH_POST_URL,
-                            },
-                        )
-                        response.raise_for_status()
-                        house_count = self._parse_entry_detail_page(response.text)
-                        return (house_count, True)
+                    async with semaphore:
+                        response = await client.get(url, headers=request_headers, timeout=timeout_seconds)
+                    response.raise_for_status()
+                    return response
                 except (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError) as exc:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        self.log(f"ENTRIES_DETAILS HTTP: ✗ Entry {idx+1} failed after {max_retries} attempts (network/timeout): {exc}")
-                        return (0, False)
+                    if last_attempt:
+                        self.log(f"ENTRIES_DETAILS HTTP: ✗ {label} failed after {max_retries} attempts (network/timeout): {exc}")
+                        return None
                 except httpx.HTTPStatusError as exc:
-                    if exc.response.status_code >= 500 and attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        self.log(f"ENTRIES_DETAILS HTTP: ✗ Entry {idx+1} failed after {max_retries} attempts (HTTP {exc.response.status_code}): {exc}")
-                        return (0, False)
-                except Exception as exc:
-                    self.log(f"ENTRIES_DETAILS HTTP: ✗ Entry {idx+1} failed: {exc}")
+                    if exc.response.status_code < 500 or last_attempt:
+                        self.log(f"ENTRIES_DETAILS HTTP: ✗ {label} failed after {max_retries} attempts (HTTP {exc.response.status_code}): {exc}")
+                        return None
+                # Full jitter, so requests that failed together do not all retry together
+                await asyncio.sleep(random.uniform(0, retry_delay * (2 ** attempt)))
+            return None
+
+        # Process entry detail pages
+        async def fetch_entry_houses(link: str, idx: int, total: int) -> Tuple[int, bool]:
+            """Fetch and parse a single entry detail page with retry logic."""
+            try:
+                # 2 minutes for entry detail pages
+                response = await get_with_retry(link, entry_detail_headers, 120.0, f"Entry {idx+1}")
+                if response is None:
                     return (0, False)
-            
-            return (0, False)
-        
-        # Process in batches
-        for start in range(0, len(entry_links), batch_size):
-            batch = entry_links[start:start + batch_size]
-            self.log(f"ENTRIES_DETAILS HTTP STEP 1.{start//batch_size + 1}: Processing batch {start//batch_size + 1} ({len(batch)} entries)...")
-            
-            tasks = [fetch_entry_houses(link, start + idx, len(entry_links)) for idx, link in enumerate(batch)]
-            results = await asyncio.gather(*tasks)
-            
-            for house_count, success in results:
-                entries_total_houses += house_count
-                if not success:
-                    entry_detail_failures += 1
-            
-            await asyncio.sleep(0.5)  # Small delay between batches
-        
-        self.log(f"ENTRIES_DETAILS HTTP STEP 1: Total houses: {entries_total_houses}")
+                return (self._parse_entry_detail_page(response.content, response.encoding), True)
+            except Exception as exc:
+                self.log(f"ENTRIES_DETAILS HTTP: ✗ Entry {idx+1} failed: {exc}")
+                return (0, False)
         
         # Process print7501 pages
-        self.log(f"ENTRIES_DETAILS HTTP STEP 2: Processing {len(query_strings)} print7501 pages in batches of {batch_size}...")
-        
         async def fetch_print7501_duty(query: str, idx: int, total: int) -> Tuple[float, bool]:
             """Fetch and parse a single print7501 page with retry logic."""
-            max_retries = 3
-            retry_delay = 1.0
-            timeout_seconds = 360.0  # 6 minutes for print7501 pages (user requested)
-            
-            url = f"{PRINT7501_URL}?{query}"
-            
-            for attempt in range(max_retries):
-                try:
-                    async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True) as req_client:
-                        for name, value in session_cookies.items():
-                            req_client.cookies.set(name, value, domain=".netchb.com")
-                        
-                        response = await req_client.get(
-                            url,
-                            headers={
-                                "User-Agent": headers["User-Agent"],
-                                "Accept": headers["Accept"],
-                                "Referer": ENTRY_DETAIL_URL,
-                            },
-                        )
-                        response.raise_for_status()
-                        duty_sum = self._parse_print7501_page(response.text)
-                        return (duty_sum, True)
-                except (httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError) as exc:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        self.log(f"ENTRIES_DETAILS HTTP: ✗ Print7501 {idx+1} failed after {max_retries} attempts (network/timeout): {exc}")
-                        return (0.0, False)
-                except httpx.HTTPStatusError as exc:
-                    if exc.response.status_code >= 500 and attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        self.log(f"ENTRIES_DETAILS HTTP: ✗ Print7501 {idx+1} failed after {max_retries} attempts (HTTP {exc.response.status_code}): {exc}")
-                        return (0.0, False)
-                except Exception as exc:
-                    self.log(f"ENTRIES_DETAILS HTTP: ✗ Print7501 {idx+1} failed: {exc}")
+            try:
+                # 6 minutes for print7501 pages (user requested)
+                response = await get_with_retry(
+                    f"{PRINT7501_URL}?{query}", print7501_headers, 360.0, f"Print7501 {idx+1}"
+                )
+                if response is None:
                     return (0.0, False)
-            
-            return (0.0, False)
+                return (self._parse_print7501_page(response.content, response.encoding), True)
+            except Exception as exc:
+                self.log(f"ENTRIES_DETAILS HTTP: ✗ Print7501 {idx+1} failed: {exc}")
+                return (0.0, False)
+        
+        # Rows of one entry share its filerCode/entryNo query: fetch each page once, and
+        # count it once per row as before
+        unique_queries = list(dict.fromkeys(query_strings))
+        self.log(f"ENTRIES_DETAILS HTTP STEP 2: Processing {len(query_strings)} print7501 pages, {max_in_flight} at a time...")
+
+        # One pipeline for both page kinds: they share the client and the semaphore, so
+        # print7501 fetches take slots as soon as they free up instead of after the last
+        # entry detail page
+        house_results, duty_results = await asyncio.gather(
+            asyncio.gather(
+                *(fetch_entry_houses(link, idx, len(entry_links)) for idx, link in enumerate(entry_links))
+            ),
+            asyncio.gather(
+                *(fetch_print7501_duty(query, idx, len(unique_queries)) for idx, query in enumerate(unique_queries))
+            ),
+        )
+        for house_count, success in house_results:
+            entries_total_houses += house_count
+            if not success:
+                entry_detail_failures += 1
         
-        # Process in batches
-        for start in range(0, len(query_strings), batch_size):
-            batch = query_strings[start:start + batch_size]
-            self.log(f"ENTRIES_DETAILS HTTP STEP 2.{start//batch_size + 1}: Processing batch {start//batch_size + 1} ({len(batch)} queries)...")
-            
-            tasks = [fetch_print7501_duty(query, start + idx, len(query_strings)) for idx, query in enumerate(batch)]
-            results = await asyncio.gather(*tasks)
-            
-            for duty_sum, success in results:
-                entries_total_duty += duty_sum
-                if not success:
-                    print7501_failures += 1
-            
-            await asyncio.sleep(0.5)  # Small delay between batches
+        self.log(f"ENTRIES_DETAILS HTTP STEP 1: Total houses: {entries_total_houses}")
+        
+        result_by_query = dict(zip(unique_queries, duty_results))
+        for query in query_strings:
+            duty_sum, success = result_by_query[query]
+            entries_total_duty += duty_sum
+            if not success:
+                print7501_failures += 1
         
         self.log(f"ENTRIES_DETAILS HTTP STEP 2: Total duty: {entries_total_duty:.2f}")
         return entries_total_houses, entries_total_duty, entry_detail_failures, print7501_failures
@@ -2102,48 +2497,46 @@ class NetChbDutyRunner:
         assert self.context
         entries_total_houses = 0
         entries_total_duty = 0.0
-        group_size = 6  # Updated to 6 (user requested)
+        max_open_pages = 6  # Updated to 6 (user requested)
+        # Pages open as slots free up rather than in fixed groups that wait on their slowest page
+        semaphore = asyncio.Semaphore(max_open_pages)
 
-        self.log(f"ENTRIES_DETAILS STEP 1: Processing {len(entry_links)} entry links in groups of {group_size}...")
+        async def bounded(scrape: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await scrape
+
+        self.log(f"ENTRIES_DETAILS STEP 1: Processing {len(entry_links)} entry links, {max_open_pages} at a time...")
 
         # Process entry detail pages
-        for start in range(0, len(entry_links), group_size):
-            group = entry_links[start : start + group_size]
-            self.log(f"ENTRIES_DETAILS STEP 1.{start//group_size + 1}: Processing group {start//group_size + 1} ({len(group)} entries)...")
-            
-            tasks = []
-            for link in group:
-                tasks.append(self._scrape_single_entry(link))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for idx, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self.log(f"ENTRIES_DETAILS: ⚠️ Entry {idx+1} in group failed (skipped): {result}")
-                else:
-                    entries_total_houses += result
-                    self.log(f"ENTRIES_DETAILS: Entry {idx+1} in group: {result} houses")
+        results = await asyncio.gather(
+            *(bounded(self._scrape_single_entry(link)) for link in entry_links), return_exceptions=True
+        )
+        for idx, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.log(f"ENTRIES_DETAILS: ⚠️ Entry {idx+1} failed (skipped): {result}")
+            else:
+                entries_total_houses += result
+                self.log(f"ENTRIES_DETAILS: Entry {idx+1}: {result} houses")
 
         self.log(f"ENTRIES_DETAILS STEP 1: Total houses: {entries_total_houses}")
 
         # Process print7501 pages
         print_url = "https://www.netchb.com/app/entry/print7501.do?"
-        self.log(f"ENTRIES_DETAILS STEP 2: Processing {len(query_strings)} print7501 pages in groups of {group_size}...")
+        self.log(f"ENTRIES_DETAILS STEP 2: Processing {len(query_strings)} print7501 pages, {max_open_pages} at a time...")
 
-        for start in range(0, len(query_strings), group_size):
-            group = query_strings[start : start + group_size]
-            self.log(f"ENTRIES_DETAILS STEP 2.{start//group_size + 1}: Processing group {start//group_size + 1} ({len(group)} queries)...")
-            
-            tasks = []
-            for query in group:
-                tasks.append(self._scrape_single_print7501(f"{print_url}{query}"))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for idx, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self.log(f"ENTRIES_DETAILS: ⚠️ Print7501 {idx+1} in group failed (skipped): {result}")
-                else:
-                    entries_total_duty += result
-                    self.log(f"ENTRIES_DETAILS: Print7501 {idx+1} in group: ${result:.2f} duty")
+        # Duplicate queries (rows of the same entry) open the page once and reuse its result
+        unique_queries = list(dict.fromkeys(query_strings))
+        unique_results = await asyncio.gather(
+            *(bounded(self._scrape_single_print7501(f"{print_url}{query}")) for query in unique_queries),
+            return_exceptions=True,
+        )
+        result_by_query = dict(zip(unique_queries, unique_results))
+        for idx, result in enumerate(result_by_query[query] for query in query_strings):
+            if isinstance(result, Exception):
+                self.log(f"ENTRIES_DETAILS: ⚠️ Print7501 {idx+1} failed (skipped): {result}")
+            else:
+                entries_total_duty += result
+                self.log(f"ENTRIES_DETAILS: Print7501 {idx+1}: ${result:.2f} duty")
 
         self.log(f"ENTRIES_DETAILS STEP 2: Total duty: {entries_total_duty:.2f}")
         return entries_total_houses, entries_total_duty
@@ -2162,8 +2555,8 @@ class NetChbDutyRunner:
             await page.goto(link, wait_until="domcontentloaded", timeout=120000)  # 2 minutes for slow site
             self.log(f"ENTRIES_DETAILS: Waiting for #invBdy selector (timeout: 120s)...")
             await page.wait_for_selector("#invBdy", timeout=120000, state="attached")  # 2 minutes for slow site
-            rows = await page.query_selector_all("#invBdy > tr")
-            house_count = len(rows)
+            # Count in the page: no element handle per house row
+            house_count = await page.eval_on_selector_all("#invBdy > tr", "rows => rows.length")
             self.log(f"ENTRIES_DETAILS: Successfully loaded entry page, found {house_count} houses")
             return house_count
         except Exception as exc:
@@ -2187,19 +2580,20 @@ class NetChbDutyRunner:
             self.log(f"ENTRIES_DETAILS: Loading print7501 page (timeout: 360s): {url}")
             await page.goto(url, wait_until="domcontentloaded", timeout=360000)  # 6 minutes for slow print7501 pages
             self.log(f"ENTRIES_DETAILS: Waiting for print7501 table (timeout: 360s)...")
-            await page.wait_for_selector(
+            duty_table = await page.wait_for_selector(
                 "#pForm > div:nth-child(1) > div:nth-child(2) > div > div.content > table",
                 timeout=360000  # 6 minutes for slow print7501 pages
             )
-            duty1_elem = await page.query_selector(
-                "#pForm > div:nth-child(1) > div:nth-child(2) > div > div.content > table > tbody > tr:nth-child(2) > td:nth-child(2)"
-            )
-            duty2_elem = await page.query_selector(
-                "#pForm > div:nth-child(1) > div:nth-child(2) > div > div.content > table > tbody > tr:nth-child(4) > td:nth-child(2)"
+            # Both duty cells (rows 2 and 4, column 2) read from the table handle in one call
+            duty1_text, duty2_text = await duty_table.evaluate(
+                _INNER_TEXTS_JS,
+                [":scope > tbody > tr:nth-child(2) > td:nth-child(2)", ":scope > tbody > tr:nth-child(4) > td:nth-child(2)"],
             )
-            duty1_text = (await duty1_elem.inner_text()).strip() if duty1_elem else "0"
-            duty2_text = (await duty2_elem.inner_text()).strip() if duty2_elem else "0"
-            duty_sum = self._parse_currency(duty1_text) + self._parse_currency(duty2_text)
+            if duty1_text is None:
+                duty1_text = "0"
+            if duty2_text is None:
+                duty2_text = "0"
+            duty_sum = float(_parse_money_text(duty1_text) + _parse_money_text(duty2_text))
             self.log(f"ENTRIES_DETAILS: Successfully loaded print7501 page, duty sum: {duty_sum:.2f}")
             return duty_sum
         except Exception as exc:
@@ -2285,32 +2679,10 @@ class NetChbDutyRunner:
         
         download_dir = Path(self.temp_dir.name)
         
-        # Get cookies from current browser context
-        storage_state = await self.context.storage_state()
-        session_cookies = self._load_cookies_from_storage_state(storage_state)
-        
-        if not session_cookies:
-            raise RuntimeError("No cookies found in session - HTTP method requires valid session cookies")
+        # Shared keep-alive client carrying the browser session's cookies
+        client = await self._session_http_client("CUSTOM HTTP")
         
-        self.log(f"CUSTOM HTTP: Using {len(session_cookies)} cookies from session")
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Mobile Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://www.netchb.com",
-            "Referer": "https://www.netchb.com/app/entry/customizableReport.jsp",
-            "Cache-Control": "max-age=0",
-            "Connection": "keep-alive",
-            "DNT": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        headers = _CUSTOM_REPORT_HTTP_HEADERS
         
         # Build form payload (full template configuration required)
         form_data = self._build_custom_report_payload(template_payload, mawb_digits, oldest_entry)
@@ -2321,28 +2693,30 @@ class NetChbDutyRunner:
         self.log(f"CUSTOM HTTP STEP 1: Manifest fields: {len(template_payload.get('manifestFields', []))}")
         self.log(f"CUSTOM HTTP STEP 1: Default values: {len(template_payload.get('defaultValues', {}))} fields")
         
-        # Custom report generation can take several minutes, so use extended timeout (5 minutes)
-        async with httpx.AsyncClient(timeout=300.0, follow_redirects=True) as client:
-            # Set cookies
-            for name, value in session_cookies.items():
-                client.cookies.set(name, value, domain=".netchb.com")
-            
-            # STEP 1: POST to download endpoint
-            self.log("CUSTOM HTTP STEP 2: POST to Custom Report download endpoint...")
-            try:
-                response = await client.post(
-                    CUSTOM_REPORT_DOWNLOAD_URL,
-                    data=form_data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                self.log(f"CUSTOM HTTP STEP 2: Response status {response.status_code}")
-                self.log(f"CUSTOM HTTP STEP 2: Content-Type: {response.headers.get('content-type')}")
-                self.log(f"CUSTOM HTTP STEP 2: Response length: {len(response.content)} bytes")
-            except Exception as exc:
-                self.log(f"CUSTOM HTTP STEP 2 ERROR: Request failed: {exc}")
-                raise RuntimeError(f"CUSTOM HTTP STEP 2 failed: {exc}") from exc
-            
+        # STEP 1: POST to download endpoint
+        self.log("CUSTOM HTTP STEP 2: POST to Custom Report download endpoint...")
+        response = None
+        try:
+            # Custom report generation can take several minutes, so use extended timeout (5 minutes)
+            request = client.build_request(
+                "POST",
+                CUSTOM_REPORT_DOWNLOAD_URL,
+                data=form_data,
+                headers=headers,
+                timeout=300.0,
+            )
+            # Only the headers are read here; the workbook body is streamed to disk below
+            response = await client.send(request, stream=True)
+            response.raise_for_status()
+            self.log(f"CUSTOM HTTP STEP 2: Response status {response.status_code}")
+            self.log(f"CUSTOM HTTP STEP 2: Content-Type: {response.headers.get('content-type')}")
+        except Exception as exc:
+            if response is not None:
+                await response.aclose()
+            self.log(f"CUSTOM HTTP STEP 2 ERROR: Request failed: {exc}")
+            raise RuntimeError(f"CUSTOM HTTP STEP 2 failed: {exc}") from exc
+        
+        try:
             # Check if response is Excel file
             content_type = response.headers.get("content-type", "")
             if "excel" not in content_type.lower() and "spreadsheet" not in content_type.lower():
@@ -2354,52 +2728,82 @@ class NetChbDutyRunner:
             file_path = download_dir / filename
             
             self.log(f"CUSTOM HTTP STEP 3: Saving Excel file to: {file_path}")
+            file_size = 0
             try:
                 with open(file_path, "wb") as f:
-                    f.write(response.content)
-                self.log(f"CUSTOM HTTP STEP 3: ✓ File saved successfully ({len(response.content)} bytes)")
+                    async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                        # Disk writes run in a worker thread so other sections keep going
+                        await asyncio.to_thread(f.write, chunk)
+                        file_size += len(chunk)
+                self.log(f"CUSTOM HTTP STEP 3: ✓ File saved successfully ({file_size} bytes)")
             except Exception as exc:
+                file_path.unlink(missing_ok=True)  # Don't leave a truncated workbook behind
                 self.log(f"CUSTOM HTTP STEP 3 ERROR: Failed to save file: {exc}")
                 raise
-            
-            # STEP 3: Parse Excel file
-            # Use template_identifier to determine parser (since we removed templateId)
-            self.log("CUSTOM HTTP STEP 4: Parsing Excel file...")
-            try:
-                report_summary.update(self._parse_custom_report_excel(file_path, template_identifier=template_identifier))
-                self.log("CUSTOM HTTP STEP 4: ✓ Excel parsed successfully")
-                self.log(f"CUSTOM HTTP STEP 4: Report Duty: {report_summary.get('Report Duty')}")
-                self.log(f"CUSTOM HTTP STEP 4: Report Total House: {report_summary.get('Report Total House')}")
-            except Exception as exc:
-                self.log(f"CUSTOM HTTP STEP 4 ERROR: Failed to parse Excel: {exc}")
+            except BaseException:
+                file_path.unlink(missing_ok=True)
                 raise
-            
-            # STEP 4: Upload to AWS S3
-            # Note: This is an optional early upload. Main upload happens in service.py with full info (airport_code, customer, template_name)
-            self.log("CUSTOM HTTP STEP 5: Uploading Excel to AWS S3...")
-            try:
-                from .storage import NetChbDutyStorageManager
-                storage_manager = NetChbDutyStorageManager()
-                # Extract template name from template_identifier for V2 suffix detection
-                template_name = None
-                if template_identifier and "shoaib" in template_identifier.lower():
-                    template_name = "Shoaib Match"  # Use known template name for V2 detection
-                storage_path, signed_url = storage_manager.upload_excel(
-                    file_path,
-                    mawb_digits,
-                    airport_code=None,  # Not available in this context
-                    customer=None,  # Not available in this context
-                    template_name=template_name,
-                )
-                report_summary["excel_storage_path"] = storage_path
-                report_summary["excel_download_url"] = signed_url
-                self.log(f"CUSTOM HTTP STEP 5: ✓ Excel uploaded to storage: {storage_path}")
-            except Exception as exc:
-                self.log(f"CUSTOM HTTP STEP 5 WARNING: Failed to upload to storage: {exc} (continuing without storage)")
-                # Don't fail the entire process if storage upload fails
-            
-            self.log("CUSTOM HTTP: Custom Report section complete (HTTP method)")
-            return file_path, report_summary
+        finally:
+            await response.aclose()
+        
+        # STEP 4: Upload to AWS S3 - started now so the upload overlaps the Excel parse
+        # Note: This is an optional early upload. Main upload happens in service.py with full info (airport_code, customer, template_name)
+        self.log("CUSTOM HTTP STEP 4: Uploading Excel to AWS S3 (in the background while parsing)...")
+        # Extract template name from template_identifier for V2 suffix detection
+        template_name = None
+        if template_identifier and "shoaib" in template_identifier.lower():
+            template_name = "Shoaib Match"  # Use known template name for V2 detection
+        
+        storage_manager = None  # Set by the upload thread; reused to remove an unparsed upload
+        
+        def upload() -> Tuple[str, str]:
+            nonlocal storage_manager
+            from .storage import NetChbDutyStorageManager
+            storage_manager = NetChbDutyStorageManager()
+            return storage_manager.upload_excel(
+                file_path,
+                mawb_digits,
+                airport_code=None,  # Not available in this context
+                customer=None,  # Not available in this context
+                template_name=template_name,
+            )
+        
+        upload_task = asyncio.create_task(asyncio.to_thread(upload))
+        
+        # STEP 5: Parse Excel file
+        # Use template_identifier to determine parser (since we removed templateId)
+        self.log("CUSTOM HTTP STEP 5: Parsing Excel file...")
+        try:
+            report_summary.update(await asyncio.to_thread(
+                self._parse_custom_report_excel, file_path, template_identifier=template_identifier
+            ))
+            self.log("CUSTOM HTTP STEP 5: ✓ Excel parsed successfully")
+            self.log(f"CUSTOM HTTP STEP 5: Report Duty: {report_summary.get('Report Duty')}")
+            self.log(f"CUSTOM HTTP STEP 5: Report Total House: {report_summary.get('Report Total House')}")
+        except Exception as exc:
+            self.log(f"CUSTOM HTTP STEP 5 ERROR: Failed to parse Excel: {exc}")
+            # A running upload thread cannot be interrupted - wait for it, then remove the
+            # unparseable workbook from storage so nothing is left unreferenced
+            (upload_result,) = await asyncio.gather(upload_task, return_exceptions=True)
+            if not isinstance(upload_result, BaseException) and storage_manager is not None:
+                try:
+                    await asyncio.to_thread(storage_manager.delete_file, upload_result[0])
+                    self.log(f"CUSTOM HTTP STEP 4: Removed unparsed Excel from storage: {upload_result[0]}")
+                except Exception as delete_exc:
+                    self.log(f"CUSTOM HTTP STEP 4 WARNING: Failed to remove unparsed Excel from storage: {delete_exc}")
+            raise
+        
+        try:
+            storage_path, signed_url = await upload_task
+            report_summary["excel_storage_path"] = storage_path
+            report_summary["excel_download_url"] = signed_url
+            self.log(f"CUSTOM HTTP STEP 4: ✓ Excel uploaded to storage: {storage_path}")
+        except Exception as exc:
+            self.log(f"CUSTOM HTTP STEP 4 WARNING: Failed to upload to storage: {exc} (continuing without storage)")
+            # Don't fail the entire process if storage upload fails
+        
+        self.log("CUSTOM HTTP: Custom Report section complete (HTTP method)")
+        return file_path, report_summary
     
     async def _process_custom_report_browser(
         self,
@@ -2431,11 +2835,14 @@ class NetChbDutyRunner:
 
         self.log(f"CUSTOM STEP 3: Searching for template: {template_identifier}")
         template_found = False
-        options = await report_page.query_selector_all("#sTemp option")
-        for option in options:
-            text = await option.inner_text()
-            if template_identifier.lower() in text.lower():
-                await report_page.select_option("#sTemp", value=await option.get_attribute("value"))
+        # Every option's text and value in one call instead of two round-trips per option
+        options = await report_page.eval_on_selector_all(
+            "#sTemp option", "options => options.map(o => [o.innerText, o.getAttribute('value')])"
+        )
+        template_lower = template_identifier.lower()
+        for text, value in options:
+            if template_lower in text.lower():
+                await report_page.select_option("#sTemp", value=value)
                 template_found = True
                 self.log(f"CUSTOM STEP 3: Template selected: {text}")
                 break
@@ -2490,22 +2897,22 @@ class NetChbDutyRunner:
         self.log("CUSTOM STEP 9: Clicking download button (#drB)...")
         
         async with report_page.expect_download(timeout=120000) as download_info:
-            await report_page.click("#drB")
+            await report_page.click("#drB", timeout=SUBMIT_TIMEOUT_MS)
         
         download = await download_info.value
         self.log(f"CUSTOM STEP 9: Download started: {download.suggested_filename}")
         
-        downloaded_file = download_dir / download.suggested_filename
-        await download.save_as(downloaded_file)
-        self.log(f"CUSTOM STEP 9: Download saved to: {downloaded_file}")
-
         renamed = download_dir / f"{mawb_digits[:3]}-{mawb_digits[3:]} customizable report.xlsx"
-        if downloaded_file != renamed:
-            shutil.move(str(downloaded_file), renamed)
-            self.log(f"CUSTOM STEP 10: File renamed to: {renamed}")
+        # Our browser writes downloads straight into download_dir, so a rename is enough
+        downloaded_file = Path(await download.path())
+        self.log(f"CUSTOM STEP 9: Download saved to: {downloaded_file}")
+        downloaded_file.replace(renamed)
+        self.log(f"CUSTOM STEP 10: File renamed to: {renamed}")
 
         # Use template_identifier for parsing (browser method)
-        report_summary.update(self._parse_custom_report_excel(renamed, template_identifier=template_identifier))
+        report_summary.update(await asyncio.to_thread(
+            self._parse_custom_report_excel, renamed, template_identifier=template_identifier
+        ))
         self.log("CUSTOM STEP 11: Excel file parsed")
 
         await report_page.close()
@@ -2516,6 +2923,37 @@ class NetChbDutyRunner:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    async def _session_http_client(self, log_prefix: str) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client with the browser session's cookies injected.
+
+        Raises:
+            RuntimeError: If the browser context has no session cookies
+        """
+        if not self.context or not self._http:
+            raise RuntimeError("Context not initialized")
+
+        storage_state = await self._get_storage_state()
+        session_cookies = self._load_cookies_from_storage_state(storage_state)
+
+        if not session_cookies:
+            raise RuntimeError("No cookies found in session - HTTP method requires valid session cookies")
+
+        self.log(f"{log_prefix}: Using {len(session_cookies)} cookies from session")
+        for name, value in session_cookies.items():
+            self._http.cookies.set(name, value, domain=".netchb.com")
+        return self._http
+
+    async def _http_get(
+        self, url: str, *, headers: Optional[Mapping[str, str]] = None, timeout: float = 60.0
+    ) -> httpx.Response:
+        """GET a read-only NetCHB page over the shared session client (no browser render)."""
+        if not self._http:
+            raise RuntimeError("HTTP client not initialized")
+        response = await self._http.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
+
     def _parse_custom_report_excel(self, path: Path, template_identifier: Optional[str] = None) -> Dict[str, str]:
         """
         Parse custom report Excel file based on template type.
@@ -2536,7 +2974,8 @@ class NetChbDutyRunner:
     def _parse_fte_match_excel(self, path: Path) -> Dict[str, str]:
         """Parse FTE Match template Excel file (templateId: 3351)."""
         self.log(f"PARSING EXCEL (FTE Match): Reading {path}")
-        workbook = load_workbook(path, data_only=True)
+        # read_only streams rows lazily instead of materialising every cell up front
+        workbook = load_workbook(path, read_only=True, data_only=True)
         sheet = workbook.active
         total_duty = 0.0
         total_house = 0
@@ -2545,23 +2984,26 @@ class NetChbDutyRunner:
         entry_dates = set()
         release_dates = set()
 
-        for row in sheet.iter_rows(min_row=2):
-            try:
-                informal = row[4].value or 0
-                complete = row[6].value or 0
-                entry_dates_val = row[2].value
-                release_date_val = row[8].value
-                if row[13].value not in (None, ""):
-                    total_house += 1
-                total_informal += float(informal)
-                complete_duty += float(complete)
-                total_duty += float(informal) + float(complete)
-                if entry_dates_val not in (None, ""):
-                    entry_dates.add(_format_excel_date(entry_dates_val))
-                if release_date_val not in (None, ""):
-                    release_dates.add(_format_excel_date(release_date_val))
-            except Exception:
-                continue
+        try:
+            for row in sheet.iter_rows(min_row=2, max_col=14, values_only=True):
+                try:
+                    informal = row[4] or 0
+                    complete = row[6] or 0
+                    entry_dates_val = row[2]
+                    release_date_val = row[8]
+                    if row[13] not in (None, ""):
+                        total_house += 1
+                    total_informal += float(informal)
+                    complete_duty += float(complete)
+                    total_duty += float(informal) + float(complete)
+                    if entry_dates_val not in (None, ""):
+                        entry_dates.add(_format_excel_date(entry_dates_val))
+                    if release_date_val not in (None, ""):
+                        release_dates.add(_format_excel_date(release_date_val))
+                except Exception:
+                    continue
+        finally:
+            workbook.close()
 
         self.log(f"PARSING EXCEL (FTE Match): Total duty={total_duty:.2f}, Houses={total_house}, Informal={total_informal:.2f}, Complete={complete_duty:.2f}")
 
@@ -2592,7 +3034,8 @@ class NetChbDutyRunner:
         - Extract unique dates from Column D and Column J
         """
         self.log(f"PARSING EXCEL (Shoaib Match): Reading {path}")
-        workbook = load_workbook(path, data_only=True)
+        # read_only streams rows lazily instead of materialising every cell up front
+        workbook = load_workbook(path, read_only=True, data_only=True)
         sheet = workbook.active
         total_duty = 0.0
         total_house = 0
@@ -2605,37 +3048,40 @@ class NetChbDutyRunner:
         unique_entries = {}  # {column_a_value: (informal, complete)}
         
         # Process all rows in a single pass
-        for row in sheet.iter_rows(min_row=2):
-            try:
-                column_a = row[0].value
-                column_d = row[3].value  # Entry date
-                column_f = row[5].value or 0  # Informal duty
-                column_h = row[7].value or 0  # Complete duty
-                column_j = row[9].value  # Release date
-                column_n = row[13].value  # House indicator
+        try:
+            for row in sheet.iter_rows(min_row=2, max_col=14, values_only=True):
+                try:
+                    column_a = row[0]
+                    column_d = row[3]  # Entry date
+                    column_f = row[5] or 0  # Informal duty
+                    column_h = row[7] or 0  # Complete duty
+                    column_j = row[9]  # Release date
+                    column_n = row[13]  # House indicator
                 
-                # Skip if Column A is empty or None (header row or invalid)
-                if column_a is None or column_a == "":
-                    continue
+                    # Skip if Column A is empty or None (header row or invalid)
+                    if column_a is None or column_a == "":
+                        continue
                 
-                # Count houses from ALL rows (not deduplicated by Column A)
-                # Ignore empty cells in Column N
-                if column_n not in (None, ""):
-                    total_house += 1
+                    # Count houses from ALL rows (not deduplicated by Column A)
+                    # Ignore empty cells in Column N
+                    if column_n not in (None, ""):
+                        total_house += 1
                 
-                # Deduplicate duties by Column A (only sum once per unique Column A value)
-                if column_a not in unique_entries:
-                    unique_entries[column_a] = (float(column_f), float(column_h))
-                    total_informal += float(column_f)
-                    complete_duty += float(column_h)
+                    # Deduplicate duties by Column A (only sum once per unique Column A value)
+                    if column_a not in unique_entries:
+                        unique_entries[column_a] = (float(column_f), float(column_h))
+                        total_informal += float(column_f)
+                        complete_duty += float(column_h)
                 
-                # Collect dates (from all rows, not just unique)
-                if column_d not in (None, ""):
-                    entry_dates.add(_format_excel_date(column_d))
-                if column_j not in (None, ""):
-                    release_dates.add(_format_excel_date(column_j))
-            except Exception:
-                continue
+                    # Collect dates (from all rows, not just unique)
+                    if column_d not in (None, ""):
+                        entry_dates.add(_format_excel_date(column_d))
+                    if column_j not in (None, ""):
+                        release_dates.add(_format_excel_date(column_j))
+                except Exception:
+                    continue
+        finally:
+            workbook.close()
         
         total_duty = total_informal + complete_duty
         
@@ -2728,17 +3174,10 @@ class NetChbDutyRunner:
         
         return payload
     
-    @staticmethod
-    def _parse_currency(value: str) -> float:
-        try:
-            return float(value.replace(",", "").replace("$", ""))
-        except Exception:
-            return 0.0
-
     async def _download_7501_batch_pdf_http(
         self,
         mawb_digits: str,
-        entry_rows: Optional[List[Dict]] = None,
+        entry_rows: Optional[List[EntryRow]] = None,
         session_cookies: Optional[Dict[str, str]] = None,
     ) -> Optional[Path]:
         """
@@ -2757,7 +3196,7 @@ class NetChbDutyRunner:
         
         # Get cookies if not provided
         if not session_cookies:
-            storage_state = await self.context.storage_state()
+            storage_state = await self._get_storage_state()
             session_cookies = self._load_cookies_from_storage_state(storage_state)
         
         if not session_cookies:
@@ -2766,262 +3205,217 @@ class NetChbDutyRunner:
         
         self.log(f"PDF DOWNLOAD: Starting 7501 batch PDF download for MAWB {mawb_digits}")
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://www.netchb.com",
-            "Referer": "https://www.netchb.com/app/entry/index.jsp",
-            "Cache-Control": "max-age=0",
-            "Connection": "keep-alive",
-            "DNT": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        headers = _HTTP_FORM_HEADERS
         
+        if not self._http:
+            raise RuntimeError("HTTP client not initialized")
         # PDF generation can take several minutes for large batches, so use extended timeout (10 minutes)
         # Note: This timeout is necessary as NetCHB can take time to generate PDFs
-        async with httpx.AsyncClient(timeout=600.0, follow_redirects=True) as client:
-            # Set cookies
-            for name, value in session_cookies.items():
-                client.cookies.set(name, value, domain=".netchb.com")
+        request_timeout = 600.0
+        client = self._http  # Shared keep-alive client - no new TLS handshake per download
+        for name, value in session_cookies.items():
+            client.cookies.set(name, value, domain=".netchb.com")
+        
+        # STEP 1: Get entry numbers (reuse if provided, otherwise fetch)
+        entry_numbers = []
+        
+        def extract_entry_no_from_row(row):
+            """Extract entry number from entry row (from query_string or link)."""
+            # Try query_string first (format: "filerCode=...&entryNo=12345")
+            query_string = row.query_string
+            if query_string:
+                match = _ENTRY_NO_RE.search(query_string)
+                if match:
+                    return match.group(1)
+            
+            # Fallback: try link (format: "?filerCode=...&entryNo=12345")
+            link = row.link
+            if link:
+                match = _ENTRY_NO_RE.search(link)
+                if match:
+                    return match.group(1)
             
-            # STEP 1: Get entry numbers (reuse if provided, otherwise fetch)
+            return None
+        
+        if entry_rows:
+            self.log(f"PDF DOWNLOAD STEP 1: Using pre-fetched entry_rows ({len(entry_rows)} rows)")
             entry_numbers = []
-            
-            def extract_entry_no_from_row(row):
-                """Extract entry number from entry row (from query_string or link)."""
-                # Try query_string first (format: "filerCode=...&entryNo=12345")
-                query_string = row.get("query_string", "")
-                if query_string:
-                    match = re.search(r"entryNo=(\d+)", query_string)
-                    if match:
-                        return match.group(1)
-                
-                # Fallback: try link (format: "?filerCode=...&entryNo=12345")
-                link = row.get("link", "")
-                if link:
-                    match = re.search(r"entryNo=(\d+)", link)
-                    if match:
-                        return match.group(1)
-                
-                return None
-            
-            if entry_rows:
-                self.log(f"PDF DOWNLOAD STEP 1: Using pre-fetched entry_rows ({len(entry_rows)} rows)")
-                entry_numbers = []
-                for row in entry_rows:
-                    entry_no = extract_entry_no_from_row(row)
-                    if entry_no:
-                        entry_numbers.append(entry_no)
-                self.log(f"PDF DOWNLOAD STEP 1: Extracted {len(entry_numbers)} entry numbers from pre-fetched rows")
-            else:
-                self.log("PDF DOWNLOAD STEP 1: Fetching entries data...")
-                form_data = {
-                    "entryNoSearch": "",
-                    "brokerRefNo": "",
-                    "importerRecord": "0",
-                    "importerRecordName": "",
-                    "importerSearchByProfile": "true",
-                    "ultimateConsignee": "0",
-                    "ultimateConsigneeName": "",
-                    "ultimateConsigneeSearchByProfile": "true",
-                    "freightForwarder": "0",
-                    "freightForwarderName": "",
-                    "freightForwarderSearchByProfile": "true",
-                    "begin": "",
-                    "end": "",
-                    "entryStatus": "",
-                    "cargoReleaseStatus": "",
-                    "manifestStatus": "",
-                    "pgaAgency": "",
-                    "ogaStatus": "",
-                    "statusColor": "",
-                    "entryType": "",
-                    "portEntry": "",
-                    "modeTransport": "",
-                    "masterBill": mawb_digits,
-                    "searchTimePeriod": "Y1",
-                    "user": "",
-                    "location": "0",
-                    "noPerPage": "1000",
-                    "entryNo": "0",
-                    "orderBy": "vep1",
-                    "page": "0",
-                    "unchecked7501": "",
-                    "unchecked3461": "",
-                    "method": "view",
-                }
-                
-                try:
-                    response = await client.post(
-                        ENTRIES_SEARCH_POST_URL,
-                        data=form_data,
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    search_data = self._parse_entries_search_results(response.text)
-                    if search_data and search_data.get("entry_rows"):
-                        for row in search_data["entry_rows"]:
-                            entry_no = extract_entry_no_from_row(row)
-                            if entry_no:
-                                entry_numbers.append(entry_no)
-                except Exception as exc:
-                    self.log(f"PDF DOWNLOAD STEP 1 ERROR: Failed to fetch entries: {exc}")
-                    return None
-            
-            if not entry_numbers:
-                self.log("PDF DOWNLOAD STEP 1: No entries found for this MAWB")
-                return None
-            
-            self.log(f"PDF DOWNLOAD STEP 1: Found {len(entry_numbers)} entries")
-            
-            # STEP 2: DIRECT PDF GENERATION (skipping form page request)
-            # Tested and confirmed: We can generate PDF directly without requesting form page first
-            # This saves ~10 seconds per PDF download by eliminating one HTTP request
-            # 
-            # BACKUP CODE (commented for reference - in case direct method fails in future):
-            # ============================================================================
-            # # STEP 2: Request PDF form page
-            # self.log("PDF DOWNLOAD STEP 2: Requesting PDF form page...")
-            # pdf_form_payload = {
-            #     "entryNoSearch": "",
-            #     "brokerRefNo": "",
-            #     "importerRecord": "0",
-            #     "importerRecordName": "",
-            #     "importerSearchByProfile": "true",
-            #     "ultimateConsignee": "0",
-            #     "ultimateConsigneeName": "",
-            #     "ultimateConsigneeSearchByProfile": "true",
-            #     "freightForwarder": "0",
-            #     "freightForwarderName": "",
-            #     "freightForwarderSearchByProfile": "true",
-            #     "begin": "",
-            #     "end": "",
-            #     "entryStatus": "",
-            #     "cargoReleaseStatus": "",
-            #     "manifestStatus": "",
-            #     "pgaAgency": "",
-            #     "ogaStatus": "",
-            #     "statusColor": "",
-            #     "entryType": "",
-            #     "portEntry": "",
-            #     "modeTransport": "",
-            #     "masterBill": mawb_digits,
-            #     "searchTimePeriod": "Y1",
-            #     "user": "",
-            #     "location": "0",
-            #     "noPerPage": "1000",
-            #     "entryNo": "0",
-            #     "orderBy": "vep1",
-            #     "page": "0",
-            #     "unchecked7501": "",
-            #     "unchecked3461": "",
-            #     "method": "print7501Batch",
-            # }
-            # 
-            # # Add print7501[ENTRY_NO]=true for each entry
-            # for entry_no in entry_numbers:
-            #     pdf_form_payload[f"print7501[{entry_no}]"] = "true"
-            # 
-            # try:
-            #     form_response = await client.post(
-            #         ENTRIES_SEARCH_POST_URL,
-            #         data=pdf_form_payload,
-            #         headers=headers,
-            #     )
-            #     form_response.raise_for_status()
-            #     
-            #     # Parse PDF form page
-            #     soup = BeautifulSoup(form_response.text, "html.parser")
-            #     form = soup.find("form", action="/app/entry/7501_Batch.pdf")
-            #     if not form:
-            #         self.log("PDF DOWNLOAD STEP 2 ERROR: PDF form not found")
-            #         return None
-            #     
-            #     entry_nos_input = form.find("input", {"name": "entryNos"})
-            #     entry_nos_value = entry_nos_input.get("value", "") if entry_nos_input else ""
-            #     
-            #     type_input = form.find("input", {"name": "type"})
-            #     type_value = type_input.get("value", "6") if type_input else "6"
-            #     
-            #     signature_input = form.find("input", {"name": "signature"})
-            #     signature_value = signature_input.get("value", "") if signature_input else ""
-            #     
-            #     date_input = form.find("input", {"name": "signedDate"})
-            #     signed_date = datetime.now().strftime("%m%d%y")
-            #     if date_input:
-            #         signed_date = date_input.get("value", signed_date)
-            #     
-            #     self.log(f"PDF DOWNLOAD STEP 2: ✓ PDF form page loaded (entryNos: {entry_nos_value[:50]}...)")
-            #     
-            # except Exception as exc:
-            #     self.log(f"PDF DOWNLOAD STEP 2 ERROR: Failed to get PDF form: {exc}")
-            #     return None
-            # ============================================================================
-            
-            # Direct PDF generation - construct payload directly without form page
-            self.log("PDF DOWNLOAD STEP 2: Constructing PDF payload directly (skipping form page request)...")
-            
-            # Construct entryNos value: comma-separated entry numbers with trailing comma
-            # Format: "12345,67890,11111,"
-            entry_nos_value = ",".join(entry_numbers) + ","
-            
-            # Set default values directly (no need to fetch from form)
-            type_value = "6"  # Always "6" based on testing
-            signature_value = ""  # Empty/default
-            signed_date = datetime.now().strftime("%m%d%y")  # Current date in MMDDYY format
-            
-            self.log(f"PDF DOWNLOAD STEP 2: ✓ Payload constructed directly (entryNos: {entry_nos_value[:50]}..., type: {type_value}, date: {signed_date})")
-            
-            # STEP 3: Generate PDF
-            self.log(f"PDF DOWNLOAD STEP 3: Generating PDF for {len(entry_numbers)} entries...")
-            self.log("PDF DOWNLOAD STEP 3: ⏳ This may take several minutes for large batches. Please wait...")
-            PDF_BATCH_URL = "https://www.netchb.com/app/entry/7501_Batch.pdf"
-            
-            pdf_generation_payload = {
-                "signature": signature_value,
-                "digitalSignature": "",
-                "signedDate": signed_date,
-                "broker": "false",
-                "cashier": "false",
-                "record": "false",
-                "original": "false",
-                "multiple": "false",
-                "type7501": "2",  # New 7501 Format
-                "separateConsignees": "false",
-                "printPartNumbers": "false",
-                "printMfrName": "false",
-                "entryNoBlank": "false",
-                "entryNos": entry_nos_value,
-                "type": type_value,
-            }
+            for row in entry_rows:
+                entry_no = extract_entry_no_from_row(row)
+                if entry_no:
+                    entry_numbers.append(entry_no)
+            self.log(f"PDF DOWNLOAD STEP 1: Extracted {len(entry_numbers)} entry numbers from pre-fetched rows")
+        else:
+            self.log("PDF DOWNLOAD STEP 1: Fetching entries data...")
+            form_data = {**_ENTRIES_VIEW_FORM, "masterBill": mawb_digits}
             
             try:
-                # PDF generation request with extended timeout (30 minutes)
-                # NetCHB can take a very long time to generate batch PDFs
-                import time
-                start_time = time.time()
-                
-                pdf_response = await client.post(
-                    PDF_BATCH_URL,
-                    data=pdf_generation_payload,
-                    headers={**headers, "Content-Type": "application/x-www-form-urlencoded"},
+                response = await client.post(
+                    ENTRIES_SEARCH_POST_URL,
+                    data=form_data,
+                    headers=headers,
+                    timeout=request_timeout,
                 )
-                
-                elapsed_time = time.time() - start_time
-                self.log(f"PDF DOWNLOAD STEP 3: ⏱️ PDF generation request completed in {elapsed_time:.1f} seconds ({elapsed_time/60:.1f} minutes)")
-                
+                response.raise_for_status()
+                search_data = self._parse_entries_search_results(response.content, response.encoding)
+                if search_data and search_data.get("entry_rows"):
+                    for row in search_data["entry_rows"]:
+                        entry_no = extract_entry_no_from_row(row)
+                        if entry_no:
+                            entry_numbers.append(entry_no)
+            except Exception as exc:
+                self.log(f"PDF DOWNLOAD STEP 1 ERROR: Failed to fetch entries: {exc}")
+                return None
+        
+        if not entry_numbers:
+            self.log("PDF DOWNLOAD STEP 1: No entries found for this MAWB")
+            return None
+        
+        self.log(f"PDF DOWNLOAD STEP 1: Found {len(entry_numbers)} entries")
+        
+        # STEP 2: DIRECT PDF GENERATION (skipping form page request)
+        # Tested and confirmed: We can generate PDF directly without requesting form page first
+        # This saves ~10 seconds per PDF download by eliminating one HTTP request
+        # 
+        # BACKUP CODE (commented for reference - in case direct method fails in future):
+        # ============================================================================
+        # # STEP 2: Request PDF form page
+        # self.log("PDF DOWNLOAD STEP 2: Requesting PDF form page...")
+        # pdf_form_payload = {
+        #     "entryNoSearch": "",
+        #     "brokerRefNo": "",
+        #     "importerRecord": "0",
+        #     "importerRecordName": "",
+        #     "importerSearchByProfile": "true",
+        #     "ultimateConsignee": "0",
+        #     "ultimateConsigneeName": "",
+        #     "ultimateConsigneeSearchByProfile": "true",
+        #     "freightForwarder": "0",
+        #     "freightForwarderName": "",
+        #     "freightForwarderSearchByProfile": "true",
+        #     "begin": "",
+        #     "end": "",
+        #     "entryStatus": "",
+        #     "cargoReleaseStatus": "",
+        #     "manifestStatus": "",
+        #     "pgaAgency": "",
+        #     "ogaStatus": "",
+        #     "statusColor": "",
+        #     "entryType": "",
+        #     "portEntry": "",
+        #     "modeTransport": "",
+        #     "masterBill": mawb_digits,
+        #     "searchTimePeriod": "Y1",
+        #     "user": "",
+        #     "location": "0",
+        #     "noPerPage": "1000",
+        #     "entryNo": "0",
+        #     "orderBy": "vep1",
+        #     "page": "0",
+        #     "unchecked7501": "",
+        #     "unchecked3461": "",
+        #     "method": "print7501Batch",
+        # }
+        # 
+        # # Add print7501[ENTRY_NO]=true for each entry
+        # for entry_no in entry_numbers:
+        #     pdf_form_payload[f"print7501[{entry_no}]"] = "true"
+        # 
+        # try:
+        #     form_response = await client.post(
+        #         ENTRIES_SEARCH_POST_URL,
+        #         data=pdf_form_payload,
+        #         headers=headers,
+        #     )
+        #     form_response.raise_for_status()
+        #     
+        #     # Parse PDF form page
+        #     soup = BeautifulSoup(form_response.text, "html.parser")
+        #     form = soup.find("form", action="/app/entry/7501_Batch.pdf")
+        #     if not form:
+        #         self.log("PDF DOWNLOAD STEP 2 ERROR: PDF form not found")
+        #         return None
+        #     
+        #     entry_nos_input = form.find("input", {"name": "entryNos"})
+        #     entry_nos_value = entry_nos_input.get("value", "") if entry_nos_input else ""
+        #     
+        #     type_input = form.find("input", {"name": "type"})
+        #     type_value = type_input.get("value", "6") if type_input else "6"
+        #     
+        #     signature_input = form.find("input", {"name": "signature"})
+        #     signature_value = signature_input.get("value", "") if signature_input else ""
+        #     
+        #     date_input = form.find("input", {"name": "signedDate"})
+        #     signed_date = datetime.now().strftime("%m%d%y")
+        #     if date_input:
+        #         signed_date = date_input.get("value", signed_date)
+        #     
+        #     self.log(f"PDF DOWNLOAD STEP 2: ✓ PDF form page loaded (entryNos: {entry_nos_value[:50]}...)")
+        #     
+        # except Exception as exc:
+        #     self.log(f"PDF DOWNLOAD STEP 2 ERROR: Failed to get PDF form: {exc}")
+        #     return None
+        # ============================================================================
+        
+        # Direct PDF generation - construct payload directly without form page
+        self.log("PDF DOWNLOAD STEP 2: Constructing PDF payload directly (skipping form page request)...")
+        
+        # Construct entryNos value: comma-separated entry numbers with trailing comma
+        # Format: "12345,67890,11111,"
+        entry_nos_value = ",".join(entry_numbers) + ","
+        
+        # Set default values directly (no need to fetch from form)
+        type_value = "6"  # Always "6" based on testing
+        signature_value = ""  # Empty/default
+        signed_date = datetime.now().strftime("%m%d%y")  # Current date in MMDDYY format
+        
+        self.log(f"PDF DOWNLOAD STEP 2: ✓ Payload constructed directly (entryNos: {entry_nos_value[:50]}..., type: {type_value}, date: {signed_date})")
+        
+        # STEP 3: Generate PDF
+        self.log(f"PDF DOWNLOAD STEP 3: Generating PDF for {len(entry_numbers)} entries...")
+        self.log("PDF DOWNLOAD STEP 3: ⏳ This may take several minutes for large batches. Please wait...")
+        PDF_BATCH_URL = "https://www.netchb.com/app/entry/7501_Batch.pdf"
+        
+        pdf_generation_payload = {
+            "signature": signature_value,
+            "digitalSignature": "",
+            "signedDate": signed_date,
+            "broker": "false",
+            "cashier": "false",
+            "record": "false",
+            "original": "false",
+            "multiple": "false",
+            "type7501": "2",  # New 7501 Format
+            "separateConsignees": "false",
+            "printPartNumbers": "false",
+            "printMfrName": "false",
+            "entryNoBlank": "false",
+            "entryNos": entry_nos_value,
+            "type": type_value,
+        }
+        
+        try:
+            # PDF generation request with extended timeout (30 minutes)
+            # NetCHB can take a very long time to generate batch PDFs
+            start_time = time.time()
+            
+            download_dir = Path(self.temp_dir.name)
+            original_pdf_path = download_dir / f"{mawb_digits}_7501_batch_original.pdf"
+            
+            # Stream the PDF straight to disk so multi-MB batches are never held in memory
+            async with client.stream(
+                "POST",
+                PDF_BATCH_URL,
+                data=pdf_generation_payload,
+                headers={**headers, "Content-Type": "application/x-www-form-urlencoded"},
+                timeout=request_timeout,
+            ) as pdf_response:
                 pdf_response.raise_for_status()
                 
-                # Check if response is PDF
+                # Check if response is PDF before writing anything
                 content_type = pdf_response.headers.get("content-type", "")
                 if "pdf" not in content_type.lower():
+                    await pdf_response.aread()
                     self.log(f"PDF DOWNLOAD STEP 3 ERROR: Unexpected content type: {content_type}")
                     self.log(f"PDF DOWNLOAD STEP 3 ERROR: Response length: {len(pdf_response.content)} bytes")
                     # Sometimes NetCHB returns HTML error pages instead of PDF
@@ -3034,39 +3428,84 @@ class NetChbDutyRunner:
                     return None
                 
                 # Save original PDF
-                download_dir = Path(self.temp_dir.name)
-                original_pdf_path = download_dir / f"{mawb_digits}_7501_batch_original.pdf"
-                with open(original_pdf_path, "wb") as f:
-                    f.write(pdf_response.content)
-                
-                original_size = len(pdf_response.content)
-                self.log(f"PDF DOWNLOAD STEP 3: ✓ PDF downloaded successfully ({original_size:,} bytes, {original_size/1024/1024:.2f} MB)")
+                original_size = 0
+                try:
+                    with open(original_pdf_path, "wb") as f:
+                        async for chunk in pdf_response.aiter_bytes(chunk_size=1024 * 1024):
+                            # Disk writes run in a worker thread so other sections keep going
+                            await asyncio.to_thread(f.write, chunk)
+                            original_size += len(chunk)
+                except BaseException:
+                    original_pdf_path.unlink(missing_ok=True)  # Don't leave a truncated PDF behind
+                    raise
+            
+            elapsed_time = time.time() - start_time
+            self.log(f"PDF DOWNLOAD STEP 3: ⏱️ PDF generation request completed in {elapsed_time:.1f} seconds ({elapsed_time/60:.1f} minutes)")
+            
+            self.log(f"PDF DOWNLOAD STEP 3: ✓ PDF downloaded successfully ({original_size:,} bytes, {original_size/1024/1024:.2f} MB)")
+            
+            # STEP 4: Compress PDF
+            self.log("PDF DOWNLOAD STEP 4: Compressing PDF...")
+            compressed_pdf_path = download_dir / f"{mawb_digits}_7501_batch.pdf"
+            
+            try:
+                # Ghostscript runs as a blocking subprocess (up to 2 minutes) - keep it off the event loop
+                compressed_pdf_path = await asyncio.to_thread(
+                    self._compress_pdf_ghostscript, original_pdf_path, compressed_pdf_path
+                )
+                compressed_size = compressed_pdf_path.stat().st_size
+                reduction_pct = ((original_size - compressed_size) / original_size) * 100
+                self.log(f"PDF DOWNLOAD STEP 4: ✓ PDF compressed ({original_size:,} bytes → {compressed_size:,} bytes, {reduction_pct:.1f}% reduction)")
                 
-                # STEP 4: Compress PDF
-                self.log("PDF DOWNLOAD STEP 4: Compressing PDF...")
-                compressed_pdf_path = download_dir / f"{mawb_digits}_7501_batch.pdf"
+                # Delete original PDF
+                original_pdf_path.unlink()
                 
-                try:
-                    compressed_pdf_path = self._compress_pdf_ghostscript(original_pdf_path, compressed_pdf_path)
-                    compressed_size = compressed_pdf_path.stat().st_size
-                    reduction_pct = ((original_size - compressed_size) / original_size) * 100
-                    self.log(f"PDF DOWNLOAD STEP 4: ✓ PDF compressed ({original_size:,} bytes → {compressed_size:,} bytes, {reduction_pct:.1f}% reduction)")
-                    
-                    # Delete original PDF
-                    original_pdf_path.unlink()
-                    
-                    return compressed_pdf_path
-                    
-                except Exception as exc:
-                    self.log(f"PDF DOWNLOAD STEP 4 WARNING: Compression failed: {exc} - using original PDF")
-                    # Fallback to original if compression fails
-                    compressed_pdf_path.unlink(missing_ok=True)
-                    original_pdf_path.rename(compressed_pdf_path)
-                    return compressed_pdf_path
+                return compressed_pdf_path
                 
             except Exception as exc:
-                self.log(f"PDF DOWNLOAD STEP 3 ERROR: Failed to generate PDF: {exc}")
-                return None
+                self.log(f"PDF DOWNLOAD STEP 4 WARNING: Compression failed: {exc} - using original PDF")
+                # Fallback to original if compression fails
+                compressed_pdf_path.unlink(missing_ok=True)
+                original_pdf_path.rename(compressed_pdf_path)
+                return compressed_pdf_path
+            
+        except Exception as exc:
+            self.log(f"PDF DOWNLOAD STEP 3 ERROR: Failed to generate PDF: {exc}")
+            return None
+
+    async def _extract_and_upload_7501_pdf(
+        self,
+        pdf_path: Path,
+        mawb_digits: str,
+        airport_code: Optional[str] = None,
+        customer: Optional[str] = None,
+    ) -> Tuple[Union[Tuple[int, float], Exception], Union[Tuple[str, str], Exception]]:
+        """
+        Extract entries/duty from the 7501 batch PDF and upload it to storage concurrently.
+        
+        Both steps block (PDF parsing is CPU-bound, the upload is network I/O) and only
+        read the file, so they run side by side in worker threads, leaving the event loop
+        free for other MAWBs.
+        
+        Returns:
+            ((entry_count, total_duty) or exception, (storage_path, url) or exception)
+        """
+        def extract() -> Tuple[int, float]:
+            from .pdf_extractor import extract_entries_and_duty_from_pdf
+            return extract_entries_and_duty_from_pdf(pdf_path)
+        
+        def upload() -> Tuple[str, str]:
+            from .storage import NetChbDutyStorageManager
+            storage = NetChbDutyStorageManager()
+            # Use airport_code and customer if provided (for file naming)
+            return storage.upload_pdf(pdf_path, mawb_digits, airport_code=airport_code, customer=customer)
+        
+        extract_result, upload_result = await asyncio.gather(
+            asyncio.to_thread(extract),
+            asyncio.to_thread(upload),
+            return_exceptions=True,
+        )
+        return extract_result, upload_result
 
     def _compress_pdf_ghostscript(self, input_path: Path, output_path: Path) -> Path:
         """
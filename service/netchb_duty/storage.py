@@ -208,3 +208,12 @@ class NetChbDutyStorageManager:
             raise
         except Exception as exc:
             raise RuntimeError(f"Failed to download file from S3: {exc}") from exc
+
+    def delete_file(self, storage_path: str) -> None:
+        """
+        Delete a file from storage (missing files are not an error).
+        
+        Args:
+            storage_path: Path to file in storage (S3 key)
+        """
+        self.s3_client.delete_file(storage_path)